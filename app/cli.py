@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Provides a command-line interface for running the model without a GUI.
+Only app.model is imported, so no display or Qt is needed.
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import sys
+import time
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+
+from .model.model import Model, ResultTable
+from .model.sweep import SweepCase, SweepRunner
+
+_CASE_FIELDS = ["num_lat_zones", "lat_transfer_coeff", "initial_gat"]
+_RESULT_FIELDS = ["delta", "solar_mult", "avg"]
+
+_Parser = argparse.ArgumentParser
+
+
+def _parser() -> tuple[_Parser, dict[str, _Parser]]:
+    # Return the parser and its subcommand parsers, by command.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--config",
+        type=Path,
+        help="JSON file of option values, keyed by option name, e.g. "
+        '{"lat_bands": 18}.  Command-line options take precedence.',
+    )
+    common.add_argument("--min-solar-mult", type=float, default=4.0)
+    common.add_argument("--max-solar-mult", type=float, default=8.0)
+    common.add_argument("--num-solar-mults", type=int, default=10)
+    common.add_argument(
+        "--format", choices=["csv", "npz"], default="csv", dest="fmt"
+    )
+    common.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Output file, or - (the default) for stdout.",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="one_dim_ebm.py",
+        description="Compute global average temperature vs. solar "
+        "multiplier, without the GUI.  Run with no arguments for the GUI.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser(
+        "run", parents=[common], help="Run one hysteresis sweep."
+    )
+    run.add_argument("--lat-bands", type=int, default=9)
+    run.add_argument("--lat-transfer-coeff", type=float, default=7.6)
+    run.add_argument("--initial-gat", type=float, default=-60.0)
+    run.add_argument(
+        "--block-size",
+        type=int,
+        default=64,
+        help="Number of results to compute between writes.",
+    )
+
+    sweep = subparsers.add_parser(
+        "sweep",
+        parents=[common],
+        help="Run a hysteresis sweep for every combination of parameters.",
+        description="Run a hysteresis sweep for every combination of "
+        "parameters.  CSV output has one row per result, with columns "
+        "for the largest number of latitude bands; rows for cases with "
+        "fewer bands leave the remaining temp columns empty.",
+    )
+    sweep.add_argument("--lat-bands", type=int, nargs="+", default=[9])
+    sweep.add_argument(
+        "--lat-transfer-coeff", type=float, nargs="+", default=[7.6]
+    )
+    sweep.add_argument(
+        "--initial-gat", type=float, nargs="+", default=[-60.0]
+    )
+    sweep.add_argument("--max-workers", type=int)
+    sweep.add_argument(
+        "--cache-dir", type=Path, help="Directory for caching sweeps."
+    )
+    return (parser, {"run": run, "sweep": sweep})
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser, subparsers = _parser()
+    args = parser.parse_args(argv)
+    if args.config is not None:
+        subparser = subparsers[args.command]
+        config = json.loads(args.config.read_text())
+        # Options given on the command line override the config file.
+        subparser.set_defaults(**_config_defaults(subparser, config))
+        args = parser.parse_args(argv)
+    _check_args(subparsers[args.command], args)
+    return args
+
+
+def _check_args(parser: _Parser, args: argparse.Namespace) -> None:
+    # Reject values which argparse's types can't.
+    if args.min_solar_mult >= args.max_solar_mult:
+        parser.error("--min-solar-mult must be less than --max-solar-mult")
+    if args.num_solar_mults < 2:
+        parser.error("--num-solar-mults must be at least 2")
+    lat_bands = args.lat_bands
+    if min(lat_bands if isinstance(lat_bands, list) else [lat_bands]) < 1:
+        parser.error("--lat-bands must be at least 1")
+
+
+def _config_defaults(
+    parser: argparse.ArgumentParser, config: dict[str, tp.Any]
+) -> dict[str, tp.Any]:
+    # Convert config values, keyed by option name, to parser defaults,
+    # keyed by dest.
+    actions = {}
+    for action in parser._actions:
+        for option in action.option_strings:
+            if option.startswith("--") and option != "--config":
+                actions[option[2:].replace("-", "_")] = action
+
+    result = {}
+    for key, value in config.items():
+        action = actions.get(key.replace("-", "_"))
+        if action is None or action.dest == "help":
+            parser.error(f"unknown option in config file: {key}")
+        if action.nargs == "+" and not isinstance(value, list):
+            value = [value]
+        result[action.dest] = value
+    return result
+
+
+def _csv_header(num_lat_zones: int, with_case: bool) -> list[str]:
+    temps = [f"temp_{i}" for i in range(num_lat_zones)]
+    return (_CASE_FIELDS if with_case else []) + _RESULT_FIELDS + temps
+
+
+def _csv_rows(
+    deltas: np.ndarray,
+    solar_mults: np.ndarray,
+    avgs: np.ndarray,
+    temps: np.ndarray,
+    case: list[float] | None = None,
+    num_columns: int = 0,
+) -> tp.Iterable[list[float | str]]:
+    # Rows are padded with empty fields to num_columns, if need be.
+    prefix = case or []
+    for delta, solar_mult, avg, row in zip(deltas, solar_mults, avgs, temps):
+        values = prefix + [delta, solar_mult, avg] + row.tolist()
+        yield values + [""] * (num_columns - len(values))
+
+
+def _run(args: argparse.Namespace, outf: tp.BinaryIO) -> int:
+    gen = Model().gen_temp_blocks(
+        args.min_solar_mult,
+        args.max_solar_mult,
+        args.initial_gat,
+        args.lat_bands,
+        args.lat_transfer_coeff,
+        args.num_solar_mults,
+        block_size=args.block_size,
+    )
+    results = ResultTable(args.lat_bands)
+    if args.fmt == "npz":
+        for block in gen:
+            results.append_block(block)
+        _save_npz(outf, [("", results)])
+        return len(results)
+
+    text = io.TextIOWrapper(outf, newline="", write_through=True)
+    writer = csv.writer(text)
+    writer.writerow(_csv_header(args.lat_bands, False))
+    count = 0
+    for block in gen:
+        writer.writerows(
+            _csv_rows(
+                block["delta"],
+                block["solar_mult"],
+                block["avg"],
+                block["temps"],
+            )
+        )
+        count += len(block)
+    text.detach()
+    return count
+
+
+def _sweep(args: argparse.Namespace, outf: tp.BinaryIO) -> int:
+    cases = [
+        SweepCase(num_lat_zones, coeff, gat)
+        for num_lat_zones, coeff, gat in itertools.product(
+            args.lat_bands, args.lat_transfer_coeff, args.initial_gat
+        )
+    ]
+    runner = SweepRunner(
+        args.min_solar_mult,
+        args.max_solar_mult,
+        args.num_solar_mults,
+        max_workers=args.max_workers,
+        cache_dir=args.cache_dir,
+    )
+    sweeps = runner.run(cases)
+    count = sum(len(s.results) for s in sweeps)
+    if args.fmt == "npz":
+        _save_npz(
+            outf, [(f"case_{i}_", s.results) for i, s in enumerate(sweeps)]
+        )
+        return count
+
+    # Cases may differ in number of latitude bands, so rows are padded
+    # with empty temperatures to the width of the header.
+    text = io.TextIOWrapper(outf, newline="", write_through=True)
+    writer = csv.writer(text)
+    header = _csv_header(max(args.lat_bands), True)
+    writer.writerow(header)
+    for s in sweeps:
+        case = [getattr(s.case, name) for name in _CASE_FIELDS]
+        r = s.results
+        writer.writerows(
+            _csv_rows(
+                r.deltas, r.solar_mults, r.avgs, r.temps, case, len(header)
+            )
+        )
+    text.detach()
+    return count
+
+
+def _save_npz(
+    outf: tp.BinaryIO, tables: list[tuple[str, ResultTable]]
+) -> None:
+    arrays = {}
+    for prefix, table in tables:
+        for name in ["deltas", "solar_mults", "avgs", "temps", "albedos"]:
+            arrays[f"{prefix}{name}"] = getattr(table, name)
+    # np.savez needs a seekable file, which stdout may not be.
+    buf = io.BytesIO()
+    np.savez(buf, **arrays)
+    outf.write(buf.getvalue())
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    command = _run if args.command == "run" else _sweep
+
+    t0 = time.perf_counter()
+    if args.output == "-":
+        count = command(args, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.output, "wb") as outf:
+            count = command(args, outf)
+    elapsed = time.perf_counter() - t0
+
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(
+        f"{count} results in {elapsed:.3f} s ({rate:.1f} results/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
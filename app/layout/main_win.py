@@ -18,7 +18,6 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from ..view_controllers.lat_bands_vc import LatBandsVC
 from .mousing_chart import MousingChart
 
 
@@ -82,7 +81,8 @@ class MainWinContent(QWidget):
         # Display of global average temperature vs. solar multiplier,
         #   rising vs. falling
         chart = self.gatsm_chart = MousingChart()
-        chart.setAnimationOptions(QtCharts.QChart.AllAnimations)
+        # Animating series is slow for long sweeps.
+        chart.setAnimationOptions(QtCharts.QChart.GridAxisAnimations)
         chart_view = self.gatsm_view = QtCharts.QChartView(chart)
         chart_view.setRenderHint(QPainter.Antialiasing)
 
@@ -93,37 +93,52 @@ class MainWinContent(QWidget):
 
         self._main_layout.addWidget(chart_view)
 
-        # Display of albedo by latitude band, for a given
-        # point on the rising plot
+        # Displays of albedo by latitude band, for a given point on the
+        # rising and falling plots.  The 3-D views are slow to create, so
+        # they are added later by create_lat_bands_vcs.
+        self.rising_vc = None
+        self.falling_vc = None
         hbox = QHBoxLayout()
         hbox.addStretch(1)
-
-        vbox1 = QVBoxLayout()
-        vbox1.addWidget(self._label("Rising", Qt.AlignCenter))
-        vm = self.rising_vc = LatBandsVC()
-        min_size = (192, 192)
-        widget = vm.widget
-        widget.setMinimumSize(*min_size)
-        vbox1.addWidget(widget)
-        hbox.addLayout(vbox1)
-
+        self._rising_slot = self._lat_bands_slot(hbox, "Rising")
         hbox.addStretch(1)
-
-        # Display of albedo by latitude band, for a given
-        # point on the falling plot
-        vbox2 = QVBoxLayout()
-        vbox2.addWidget(self._label("Falling", Qt.AlignCenter))
-        vm = self.falling_vc = LatBandsVC()
-        widget = vm.widget
-        widget.setMinimumSize(*min_size)
-        vbox2.addWidget(widget)
-        hbox.addLayout(vbox2)
-
+        self._falling_slot = self._lat_bands_slot(hbox, "Falling")
         hbox.addStretch(1)
 
         self._main_layout.addLayout(hbox)
         self.setLayout(self._main_layout)
 
+    def create_lat_bands_vcs(self) -> None:
+        """Create the latitude band views, if not already done."""
+        if self.rising_vc is not None:
+            return
+        # Importing Qt3D is slow too.
+        from ..view_controllers.albedo_texture_mapper import (
+            AlbedoTextureMapper,
+        )
+        from ..view_controllers.lat_bands_vc import LatBandsVC
+
+        # Both views share textures.  Keep enough for every ice line
+        # position on both branches, at the maximum number of bands.
+        albedo_mapper = AlbedoTextureMapper(max_images=1024)
+        self.rising_vc = LatBandsVC(albedo_mapper)
+        self._rising_slot.layout().addWidget(self.rising_vc.widget)
+        self.falling_vc = LatBandsVC(albedo_mapper)
+        self._falling_slot.layout().addWidget(self.falling_vc.widget)
+
+    def _lat_bands_slot(self, hbox: QHBoxLayout, title: str) -> QWidget:
+        # Add a titled, empty placeholder for a latitude band view.
+        vbox = QVBoxLayout()
+        vbox.addWidget(self._label(title, Qt.AlignCenter))
+        result = QWidget()
+        result.setMinimumSize(192, 192)
+        slot_layout = QVBoxLayout()
+        slot_layout.setContentsMargins(0, 0, 0, 0)
+        result.setLayout(slot_layout)
+        vbox.addWidget(result)
+        hbox.addLayout(vbox)
+        return result
+
     def _label(
         self, text: str, align: Qt.Alignment = Qt.AlignRight
     ) -> QLabel:
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Provides a way to trace the full bifurcation diagram - stable and unstable
+equilibria vs. solar multiplier - by pseudo-arclength continuation.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .earth_model import cached_earth_model
+from .temp_solver import Error, Linearization, TempSolver
+
+
+@dataclass(frozen=True)
+class Fold:
+    """
+    A point at which a branch of equilibria turns back on itself.
+    index is the index, in the diagram, of the last point before the fold.
+    """
+
+    solar_mult: float
+    avg: float
+    index: int
+
+
+@dataclass(frozen=True)
+class BifurcationDiagram:
+    """
+    Equilibria along a continuous curve.  temps has one row per point;
+    solar_mults, avgs and stable have one value per point.
+    """
+
+    solar_mults: np.ndarray
+    avgs: np.ndarray
+    temps: np.ndarray
+    stable: np.ndarray
+    folds: list[Fold]
+
+
+class Continuation:
+    """
+    Traces equilibria through folds using pseudo-arclength continuation.
+    Albedo must vary smoothly with temperature.
+    """
+
+    # Weight of solar multiplier relative to (area-weighted) temperature,
+    # C, when measuring arclength.
+    _MULT_SCALE = 10.0
+    # Corrector convergence threshold, W/m**2, and iteration limit:
+    _TOL = 1.0e-8
+    _MAX_CORRECTIONS = 8
+    # Steps across which the tangent turns more sharply than this (cosine)
+    # are retried with a smaller step.
+    _MIN_COS_TURN = 0.95
+    # Corrections larger than this fraction of the step are rejected.
+    _MAX_CORRECTION = 0.5
+
+    def __init__(
+        self,
+        num_lat_zones: int,
+        lat_transfer_coeff: float = 7.6,
+        albedo_width: float = 1.0,
+    ) -> None:
+        if albedo_width <= 0.0:
+            raise ValueError(f"albedo_width must be > 0: {albedo_width}")
+        self._em = cached_earth_model(num_lat_zones)
+        self._solver = TempSolver(self._em, lat_transfer_coeff, albedo_width)
+
+    def trace(
+        self,
+        min_solar_mult: float,
+        max_solar_mult: float,
+        initial_gat: float,
+        step: float = 0.5,
+        min_step: float = 1.0e-4,
+        max_step: float = 1.0,
+        max_points: int = 100_000,
+    ) -> BifurcationDiagram:
+        """
+        Start from the equilibrium at min_solar_mult nearest initial_gat,
+        and follow it until the solar multiplier leaves
+        [min_solar_mult, max_solar_mult].  step is the initial arclength
+        step; it grows when the corrector converges quickly and shrinks
+        when it doesn't.
+        """
+        lats_frac = self._em.lats_frac
+        temp0 = np.full(self._em.num_zones, initial_gat)
+        temp = self._solver.solve_newton(min_solar_mult, temp0).temps
+        mult = min_solar_mult
+        lin = self._solver.linearize(mult, temp)
+
+        # Initial tangent points toward increasing solar multiplier.
+        tan_t, tan_m = self._normalize(-lin.solve(lin.d_solar_mult), 1.0)
+
+        temps = [temp]
+        mults = [mult]
+        stable = [lin.stable]
+        folds: list[Fold] = []
+        ds = step
+        while min_solar_mult <= mult <= max_solar_mult:
+            if len(mults) >= max_points:
+                raise Error(f"Exceeded {max_points} points.")
+
+            corrected = self._correct(temp, mult, tan_t, tan_m, ds)
+            if corrected is None:
+                ds /= 2.0
+                if ds < min_step:
+                    raise Error(f"Step size fell below {min_step}.")
+                continue
+            new_temp, new_mult, num_iter, lin = corrected
+
+            # The new tangent satisfies the linearized equations and keeps
+            # the orientation of the previous tangent.
+            y = lin.solve(lin.d_solar_mult)
+            m = 1.0 / (
+                self._MULT_SCALE**2 * tan_m - (lats_frac * tan_t) @ y
+            )
+            new_tan_t, new_tan_m = self._normalize(-m * y, m)
+
+            # If the tangent turned sharply the corrector may have jumped
+            # to another branch.  Try again with a smaller step.
+            cos_turn = (
+                lats_frac @ (tan_t * new_tan_t)
+                + self._MULT_SCALE**2 * tan_m * new_tan_m
+            )
+            if cos_turn < self._MIN_COS_TURN and ds > min_step:
+                ds = max(ds / 2.0, min_step)
+                continue
+
+            if np.sign(new_tan_m) != np.sign(tan_m):
+                folds.append(
+                    self._fold(
+                        (temp, mult, tan_t, tan_m),
+                        (new_temp, new_mult, new_tan_t, new_tan_m),
+                        len(mults) - 1,
+                    )
+                )
+
+            temp, mult, tan_t, tan_m = (
+                new_temp,
+                new_mult,
+                new_tan_t,
+                new_tan_m,
+            )
+            temps.append(temp)
+            mults.append(mult)
+            stable.append(lin.stable)
+
+            if num_iter <= 3:
+                ds = min(ds * 1.5, max_step)
+
+        temps_arr = np.array(temps)
+        return BifurcationDiagram(
+            np.array(mults),
+            temps_arr @ lats_frac,
+            temps_arr,
+            np.array(stable),
+            folds,
+        )
+
+    def _correct(
+        self,
+        temp0: np.ndarray,
+        mult0: float,
+        tan_t: np.ndarray,
+        tan_m: float,
+        ds: float,
+    ) -> tuple[np.ndarray, float, int, Linearization] | None:
+        # Predict a step of ds along the tangent, then use Newton's method
+        # to return to the curve of equilibria, holding the step's
+        # projection onto the tangent fixed.  Return the new point, the
+        # number of iterations, and the linearization there.  Return None
+        # if Newton's method doesn't converge.
+        lats_frac = self._em.lats_frac
+        w_tan_t = lats_frac * tan_t
+        scaled_tan_m = self._MULT_SCALE**2 * tan_m
+
+        pred_temp = temp = temp0 + ds * tan_t
+        pred_mult = mult = mult0 + ds * tan_m
+        for i in range(self._MAX_CORRECTIONS):
+            lin = self._solver.linearize(mult, temp)
+            arc = w_tan_t @ (temp - temp0) + scaled_tan_m * (mult - mult0)
+            arc_resid = arc - ds
+            err = np.max(np.abs(lin.resid))
+            if err <= self._TOL and abs(arc_resid) <= self._TOL:
+                # A big correction may have landed on another branch.
+                dist = self._norm(temp - pred_temp, mult - pred_mult)
+                if dist > self._MAX_CORRECTION * ds:
+                    return None
+                return (temp, mult, i, lin)
+
+            # Solve the bordered system by block elimination.
+            y1 = lin.solve(-lin.resid)
+            y2 = lin.solve(lin.d_solar_mult)
+            d_mult = (-arc_resid - w_tan_t @ y1) / (
+                scaled_tan_m - w_tan_t @ y2
+            )
+            temp = temp + y1 - d_mult * y2
+            mult = mult + d_mult
+            if not np.all(np.isfinite(temp)):
+                return None
+        return None
+
+    def _norm(self, d_temp: np.ndarray, d_mult: float) -> float:
+        # Arclength norm.
+        return float(
+            np.sqrt(
+                self._em.lats_frac @ d_temp**2
+                + (self._MULT_SCALE * d_mult) ** 2
+            )
+        )
+
+    def _normalize(
+        self, tan_t: np.ndarray, tan_m: float
+    ) -> tuple[np.ndarray, float]:
+        norm = self._norm(tan_t, tan_m)
+        return (tan_t / norm, tan_m / norm)
+
+    def _fold(
+        self,
+        start: tuple[np.ndarray, float, np.ndarray, float],
+        end: tuple[np.ndarray, float, np.ndarray, float],
+        index: int,
+    ) -> Fold:
+        # Estimate the fold between two points using cubic Hermite
+        # interpolation, in arclength, of the solar multiplier and of the
+        # global average temperature.
+        lats_frac = self._em.lats_frac
+        temp0, mult0, tan_t0, tan_m0 = start
+        temp1, mult1, tan_t1, tan_m1 = end
+        h = self._norm(temp1 - temp0, mult1 - mult0)
+
+        # Find where d(mult)/ds is zero.
+        m0 = h * tan_m0
+        m1 = h * tan_m1
+        coeffs = [
+            6.0 * (mult0 - mult1) + 3.0 * (m0 + m1),
+            6.0 * (mult1 - mult0) - 4.0 * m0 - 2.0 * m1,
+            m0,
+        ]
+        roots = np.roots(coeffs)
+        roots = roots[np.isreal(roots)].real
+        roots = roots[(0.0 <= roots) & (roots <= 1.0)]
+        u = roots[0] if len(roots) else m0 / (m0 - m1)
+
+        def hermite(p0: float, p1: float, d0: float, d1: float) -> float:
+            u2 = u * u
+            u3 = u2 * u
+            return float(
+                (2 * u3 - 3 * u2 + 1) * p0
+                + (u3 - 2 * u2 + u) * d0
+                + (-2 * u3 + 3 * u2) * p1
+                + (u3 - u2) * d1
+            )
+
+        fold_mult = hermite(mult0, mult1, m0, m1)
+        fold_avg = hermite(
+            lats_frac @ temp0,
+            lats_frac @ temp1,
+            h * (lats_frac @ tan_t0),
+            h * (lats_frac @ tan_t1),
+        )
+        return Fold(fold_mult, fold_avg, index)
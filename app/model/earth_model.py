@@ -3,6 +3,7 @@
 Define geometry/insolation of earth in terms of latitude bands.
 """
 
+import functools
 
 import numpy as np
 
@@ -64,3 +65,17 @@ class EarthModel:
         # Assume axial tilt relative to orbital plane averages to zero
         # over the course of a year.
         return solar_constant * lats_frac
+
+
+@functools.lru_cache(maxsize=16)
+def cached_earth_model(num_zones: int) -> EarthModel:
+    """
+    Get a shared EarthModel for num_zones.  Its arrays are read-only, so
+    it can be shared safely, including across threads.
+    cached_earth_model.cache_info() reports hit/miss statistics.
+    """
+    result = EarthModel(num_zones)
+    for value in vars(result).values():
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+    return result
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Provides a way to compute temperatures over a dense grid of solar
+multipliers and lateral heat transfer coefficients, out of core.
+"""
+
+import json
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+
+from .earth_model import cached_earth_model
+from .temp_solver import Error, TempSolver
+
+Branch = tp.Literal["rising", "falling"]
+
+
+class TiledGrid:
+    """
+    Computes rising and falling branch temperatures for every
+    (solar multiplier, lateral heat transfer coefficient) pair, one tile
+    at a time, writing them to memory-mapped .npy files in a directory.
+
+    Row i of each output holds results for solar_mults[i].  Each row is
+    solved for all of a tile's transfer coefficients at once, starting from
+    the neighboring row's temperatures: the row below for the rising
+    branch, the row above for the falling branch.  Finished tiles are
+    recorded, so an interrupted computation resumes where it stopped.
+
+    Cells for which iteration fails to converge are solved exactly
+    instead.  If that fails too they hold NaN, and the next row starts
+    them afresh, from where their branch started.
+    """
+
+    _PARAMS_FILE = "grid.json"
+
+    def __init__(
+        self,
+        out_dir: Path,
+        solar_mults: np.ndarray,
+        lat_transfer_coeffs: np.ndarray,
+        num_lat_zones: int,
+        initial_gat: float,
+        tile_shape: tuple[int, int] = (256, 256),
+    ) -> None:
+        """
+        Initialize a new instance.
+        solar_mults must be in ascending order.  If out_dir already holds
+        a grid, it must have been created with the same parameters.
+        """
+        solar_mults = np.asarray(solar_mults, dtype=float)
+        if np.any(np.diff(solar_mults) <= 0.0):
+            raise ValueError("solar_mults must be in ascending order.")
+        self._dir = Path(out_dir)
+        self._solar_mults = solar_mults
+        self._coeffs = np.asarray(lat_transfer_coeffs, dtype=float)
+        self._num_lat_zones = num_lat_zones
+        self._initial_gat = initial_gat
+        self._tile_shape = tile_shape
+        self._em = cached_earth_model(num_lat_zones)
+        self._solver = TempSolver(self._em)
+
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._check_params()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self._solar_mults), len(self._coeffs))
+
+    @property
+    def num_tiles(self) -> tuple[int, int]:
+        """Number of tiles along each grid axis."""
+        (num_rows, num_cols) = self.shape
+        (tile_rows, tile_cols) = self._tile_shape
+        return (-(-num_rows // tile_rows), -(-num_cols // tile_cols))
+
+    def avgs(self, branch: Branch) -> np.memmap:
+        """Global average temperatures, one per grid cell."""
+        return self._open(f"{branch}_avg.npy", "r")
+
+    def temps(self, branch: Branch) -> np.memmap:
+        """Latitude band temperatures, one row per grid cell."""
+        return self._open(f"{branch}_temps.npy", "r")
+
+    def done(self, branch: Branch) -> np.ndarray:
+        """Which tiles have been computed."""
+        return np.array(self._open(f"{branch}_done.npy", "r"))
+
+    def compute(self, max_tiles: int | None = None) -> int:
+        """
+        Compute any tiles which are not yet done, up to max_tiles of them.
+        Return the number of tiles computed.
+        """
+        count = 0
+        for branch in tp.get_args(Branch):
+            done = self._open(f"{branch}_done.npy", "r+")
+            avgs = self._open(f"{branch}_avg.npy", "r+")
+            temps = self._open(f"{branch}_temps.npy", "r+")
+            for tile in self._tile_order(branch):
+                if done[tile]:
+                    continue
+                if max_tiles is not None and count >= max_tiles:
+                    return count
+                self._compute_tile(branch, tile, avgs, temps)
+                avgs.flush()
+                temps.flush()
+                done[tile] = True
+                done.flush()
+                count += 1
+        return count
+
+    def _tile_order(
+        self, branch: Branch
+    ) -> tp.Generator[tuple[int, int], None, None]:
+        # Tiles must be computed after the tiles from which they are
+        # warm-started.
+        num_rows, num_cols = self.num_tiles
+        rows = range(num_rows)
+        if branch == "falling":
+            rows = rows[::-1]
+        for tile_row in rows:
+            for tile_col in range(num_cols):
+                yield (tile_row, tile_col)
+
+    def _compute_tile(
+        self,
+        branch: Branch,
+        tile: tuple[int, int],
+        avgs: np.memmap,
+        temps: np.memmap,
+    ) -> None:
+        tile_rows, tile_cols = self._tile_shape
+        row0 = tile[0] * tile_rows
+        row_f = min(row0 + tile_rows, self.shape[0])
+        cols = slice(tile[1] * tile_cols, (tile[1] + 1) * tile_cols)
+        coeffs = self._coeffs[cols]
+
+        if branch == "rising":
+            rows = range(row0, row_f)
+            if row0 == 0:
+                temp = self._branch_start(branch, cols)
+            else:
+                temp = self._warm_start(branch, cols, temps[row0 - 1, cols])
+        else:
+            rows = range(row_f - 1, row0 - 1, -1)
+            if row_f == self.shape[0]:
+                temp = self._branch_start(branch, cols)
+            else:
+                temp = self._warm_start(branch, cols, temps[row_f, cols])
+
+        for row in rows:
+            solution = self._solver.solve_batch(
+                self._solar_mults[row], temp, coeffs, raise_on_failure=False
+            )
+            row_avgs = solution.avgs
+            row_temps = solution.temps
+            for i in np.flatnonzero(~solution.converged):
+                row_avgs[i], row_temps[i] = self._solve_cell(
+                    self._solar_mults[row], coeffs[i], row_temps[i]
+                )
+            avgs[row, cols] = row_avgs
+            temps[row, cols] = row_temps
+            # Start the next row from the stored values, so that results
+            # don't depend on how the grid is tiled.
+            temp = self._warm_start(branch, cols, temps[row, cols])
+
+    def _solve_cell(
+        self, solar_mult: float, coeff: float, temp: np.ndarray
+    ) -> tuple[float, np.ndarray]:
+        # Solve exactly for one cell, starting from temp.  Return its
+        # average and band temperatures, or NaNs on failure.
+        solver = TempSolver(self._em, coeff)
+        try:
+            solution = solver.solve_direct(solar_mult, temp)
+        except Error:
+            return (np.nan, np.full_like(temp, np.nan))
+        return (solution.avg, solution.temps)
+
+    def _branch_start(self, branch: Branch, cols: slice) -> np.ndarray:
+        # Get the temperatures from which a branch starts.
+        initial = np.full(
+            (len(self._coeffs[cols]), self._num_lat_zones), self._initial_gat
+        )
+        if branch == "rising":
+            return initial
+        # The falling branch starts from the top of the rising branch.
+        top = self._open("rising_temps.npy", "r")[-1, cols]
+        return np.where(np.isnan(top), initial, top)
+
+    def _warm_start(
+        self, branch: Branch, cols: slice, temp: np.ndarray
+    ) -> np.ndarray:
+        # Get starting temperatures from a row's stored temperatures,
+        # starting failed cells from where their branch started.
+        failed = np.isnan(temp)
+        if not np.any(failed):
+            return temp
+        return np.where(failed, self._branch_start(branch, cols), temp)
+
+    def _check_params(self) -> None:
+        params = {
+            "solar_mults": self._solar_mults.tolist(),
+            "lat_transfer_coeffs": self._coeffs.tolist(),
+            "num_lat_zones": self._num_lat_zones,
+            "initial_gat": self._initial_gat,
+            "tile_shape": list(self._tile_shape),
+        }
+        params_path = self._dir / self._PARAMS_FILE
+        if params_path.exists():
+            if json.loads(params_path.read_text()) != params:
+                raise ValueError(
+                    f"{self._dir} holds a grid with different parameters."
+                )
+            return
+
+        for branch in tp.get_args(Branch):
+            self._create(f"{branch}_avg.npy", self.shape, np.float32)
+            self._create(
+                f"{branch}_temps.npy",
+                self.shape + (self._num_lat_zones,),
+                np.float32,
+            )
+            self._create(f"{branch}_done.npy", self.num_tiles, np.bool_)
+        # Write the parameters last, to mark the grid as initialized.
+        params_path.write_text(json.dumps(params))
+
+    def _create(self, name: str, shape: tuple[int, ...], dtype: type) -> None:
+        # Contents are valid only for tiles which are done, so there is
+        # no need to initialize (and page in) the whole file.
+        mm = np.lib.format.open_memmap(
+            self._dir / name, mode="w+", dtype=dtype, shape=shape
+        )
+        mm.flush()
+
+    def _open(self, name: str, mode: str) -> np.memmap:
+        return np.lib.format.open_memmap(self._dir / name, mode=mode)
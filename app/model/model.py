@@ -12,7 +12,8 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from .earth_model import EarthModel
+from .earth_model import cached_earth_model
+from .solution_cache import BranchKey, SolutionCache
 from .temp_solver import Solution, TempSolver
 
 
@@ -23,17 +24,263 @@ class AvgTempResult:
     solution: Solution
 
 
+class ResultTable:
+    """
+    Stores sweep results compactly, one array per attribute.  Values are
+    stored as float64, so nothing is lost, except albedos: they are stored
+    as the fraction of the way from land to ice albedo, quantized to
+    uint8, so step albedos are exact and smooth albedos are within 0.1%.
+    Indexing gives AvgTempResults whose temps are views of the table.
+    """
+
+    _ALBEDO_LEVELS = 255
+
+    def __init__(self, num_lat_zones: int, capacity: int = 1024) -> None:
+        self._num_lat_zones = num_lat_zones
+        self._len = 0
+        self._deltas = np.empty(capacity)
+        self._solar_mults = np.empty(capacity)
+        self._avgs = np.empty(capacity)
+        self._temps = np.empty((capacity, num_lat_zones))
+        self._ice = np.empty((capacity, num_lat_zones), dtype=np.uint8)
+
+    @classmethod
+    def from_results(
+        cls, num_lat_zones: int, results: tp.Iterable[AvgTempResult]
+    ) -> "ResultTable":
+        result = cls(num_lat_zones)
+        result.extend(results)
+        result.shrink()
+        return result
+
+    @classmethod
+    def from_arrays(
+        cls,
+        deltas: np.ndarray,
+        solar_mults: np.ndarray,
+        avgs: np.ndarray,
+        temps: np.ndarray,
+        ice_levels: np.ndarray,
+    ) -> "ResultTable":
+        """
+        Create a table which uses the given arrays, e.g. memory maps,
+        as storage without copying them.  Appending copies them.
+        """
+        result = cls(temps.shape[1], capacity=0)
+        result._deltas = deltas
+        result._solar_mults = solar_mults
+        result._avgs = avgs
+        result._temps = temps
+        result._ice = ice_levels
+        result._len = len(deltas)
+        return result
+
+    @property
+    def num_lat_zones(self) -> int:
+        return self._num_lat_zones
+
+    @property
+    def deltas(self) -> np.ndarray:
+        return self._deltas[: self._len]
+
+    @property
+    def solar_mults(self) -> np.ndarray:
+        return self._solar_mults[: self._len]
+
+    @property
+    def avgs(self) -> np.ndarray:
+        return self._avgs[: self._len]
+
+    @property
+    def temps(self) -> np.ndarray:
+        """Band temperatures, one row per result."""
+        return self._temps[: self._len]
+
+    @property
+    def albedos(self) -> np.ndarray:
+        """Band albedos, one row per result."""
+        return self._decode_albedos(self._ice[: self._len])
+
+    @property
+    def ice_levels(self) -> np.ndarray:
+        """Albedos as stored: 0 for land, 255 for ice."""
+        return self._ice[: self._len]
+
+    _COLUMNS = ["_deltas", "_solar_mults", "_avgs", "_temps", "_ice"]
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the stored results."""
+        return sum(
+            getattr(self, name)[: self._len].nbytes for name in self._COLUMNS
+        )
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> AvgTempResult:
+        i = range(self._len)[i]
+        solution = Solution(
+            self._temps[i],
+            self._decode_albedos(self._ice[i]),
+            float(self._avgs[i]),
+        )
+        return AvgTempResult(
+            float(self._deltas[i]), float(self._solar_mults[i]), solution
+        )
+
+    def __iter__(self) -> tp.Iterator[AvgTempResult]:
+        for i in range(self._len):
+            yield self[i]
+
+    def append(self, result: AvgTempResult) -> None:
+        i = self._len
+        self._reserve(i + 1)
+        solution = result.solution
+        self._deltas[i] = result.delta
+        self._solar_mults[i] = result.solar_mult
+        self._avgs[i] = solution.avg
+        self._temps[i] = solution.temps
+        self._ice[i] = self._encode_albedos(solution.albedos)
+        self._len += 1
+
+    def extend(self, results: tp.Iterable[AvgTempResult]) -> None:
+        for result in results:
+            self.append(result)
+
+    def append_block(self, block: np.ndarray) -> None:
+        """Append a block of results from Model.gen_temp_blocks."""
+        i = self._len
+        j = i + len(block)
+        self._reserve(j)
+        self._deltas[i:j] = block["delta"]
+        self._solar_mults[i:j] = block["solar_mult"]
+        self._avgs[i:j] = block["avg"]
+        self._temps[i:j] = block["temps"]
+        self._ice[i:j] = self._encode_albedos(block["albedos"])
+        self._len = j
+
+    def shrink(self) -> None:
+        """Release storage beyond what the stored results need."""
+        if len(self._deltas) > self._len:
+            self._resize(self._len)
+
+    def __getstate__(self) -> dict[str, tp.Any]:
+        # Pickle only the stored results, as plain arrays.
+        state = dict(self.__dict__)
+        for name in self._COLUMNS:
+            state[name] = np.array(getattr(self, name)[: self._len])
+        return state
+
+    def _reserve(self, capacity: int) -> None:
+        # Grow storage geometrically to hold at least capacity results.
+        old_capacity = len(self._deltas)
+        if capacity > old_capacity:
+            self._resize(max(capacity, 2 * old_capacity))
+
+    def _resize(self, capacity: int) -> None:
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self._len] = old[: self._len]
+            setattr(self, name, new)
+
+    def _encode_albedos(self, albedos: np.ndarray) -> np.ndarray:
+        land, ice = TempSolver.LAND_ALBEDO, TempSolver.ICE_ALBEDO
+        fraction = np.clip((albedos - land) / (ice - land), 0.0, 1.0)
+        return np.rint(fraction * self._ALBEDO_LEVELS).astype(np.uint8)
+
+    def _decode_albedos(self, ice: np.ndarray) -> np.ndarray:
+        land, ice_albedo = TempSolver.LAND_ALBEDO, TempSolver.ICE_ALBEDO
+        fraction = ice / self._ALBEDO_LEVELS
+        return land + fraction * (ice_albedo - land)
+
+
 @dataclass
 class ResultSeries:
     summary: str
-    results: list[AvgTempResult]
+    results: ResultTable
 
 
 ResultGen = tp.Generator[AvgTempResult, None, None]
+# Generates blocks of results.  Send a block size to change the size of
+# subsequent blocks.
+ResultBlockGen = tp.Generator[np.ndarray, int | None, None]
+
+
+def result_dtype(num_lat_zones: int) -> np.dtype:
+    """
+    Get the structured dtype for blocks of results, with one field per
+    AvgTempResult attribute and one per Solution attribute.
+    """
+    return np.dtype(
+        [
+            ("delta", np.float64),
+            ("solar_mult", np.float64),
+            ("avg", np.float64),
+            ("temps", np.float64, (num_lat_zones,)),
+            ("albedos", np.float64, (num_lat_zones,)),
+        ]
+    )
+
+
+class _BranchSolver:
+    # Solves for successive solar multipliers along one branch of a
+    # sweep, serving and storing solutions through a cache, if any.
+    def __init__(
+        self,
+        solver: TempSolver,
+        cache: SolutionCache | None,
+        key: BranchKey,
+    ) -> None:
+        self._solver = solver
+        self._cache = cache
+        self._key = key
+
+    def solve(
+        self, mult: float, prev_mult: float | None, solution: Solution
+    ) -> Solution:
+        # Solve for mult, starting from the solution for prev_mult.
+        if self._cache is None:
+            return self._solver.solve(mult, solution.temps)
+
+        cached = self._cache.get(self._key, mult)
+        if cached is not None:
+            return cached
+
+        # Start from the closest known solution on this branch.
+        temps = solution.temps
+        nearest = self._cache.nearest_behind(self._key, mult)
+        if nearest is not None:
+            near_mult, near_solution = nearest
+            if prev_mult is None or abs(mult - near_mult) < abs(
+                mult - prev_mult
+            ):
+                temps = near_solution.temps
+
+        result = self._solver.solve(mult, temps)
+        self._cache.put(self._key, mult, result)
+        return result
 
 
 # noinspection PyMethodMayBeStatic
 class Model:
+    # Results from a previous sweep are reused only if their step gives
+    # between these multiples of num_solar_mults steps.  Narrowing the
+    # range may coarsen a sweep only slightly; widening it keeps the old
+    # step until the sweep would have twice as many steps.
+    _MIN_STEP_COUNT = 0.9
+    _MAX_STEP_COUNT = 2.0
+
+    def __init__(self, cache: SolutionCache | None = None) -> None:
+        """
+        Initialize a new instance.
+        If cache is given, sweeps reuse its solutions: exact matches are
+        returned as-is, and the nearest solutions on the same branch are
+        used as starting points.
+        """
+        self._cache = cache
+
     def gen_temps(
         self,
         min_solar_mult: float,
@@ -41,30 +288,343 @@ class Model:
         initial_gat: float,
         num_lat_zones: int,
         lat_transfer_coeff: float = 7.6,
+        num_solar_mults: int = 10,
+        jump_tol: float | None = None,
+        min_step: float | None = None,
     ) -> ResultGen:
         """
         Initialize a new instance.
         The model generates global average temperature and lat band temps
         for a range of solar multiples, for a given number of latitude zones,
         for a given lateral head transfer coefficient.
-        """
-        em = EarthModel(num_lat_zones)
-        solver = TempSolver(em, lat_transfer_coeff)
 
-        gat0 = np.full(num_lat_zones, initial_gat)
+        The solar multiplier range is divided into num_solar_mults steps.
+        If jump_tol is given, any step across which the global average
+        temperature changes by more than jump_tol is subdivided, down to
+        min_step (default: 1/64 of a step), so that resolution goes where
+        the temperature jumps.
+        """
+        gat0 = np.full(num_lat_zones, initial_gat, dtype=float)
         a0 = np.full(num_lat_zones, 0.0)
 
-        num_solar_mults = 10
         delta = (max_solar_mult - min_solar_mult) / num_solar_mults
+        if min_step is None:
+            min_step = delta / 64.0
 
         ascending = np.arange(min_solar_mult, max_solar_mult, delta)
         descending = np.arange(max_solar_mult, min_solar_mult, -delta)
 
+        rising, falling = self._branch_solvers(
+            min_solar_mult,
+            max_solar_mult,
+            initial_gat,
+            num_lat_zones,
+            lat_transfer_coeff,
+        )
+
         solution = Solution(gat0, a0, 0.0)  # Starting temps
-        for mult in ascending:
-            solution = solver.solve(mult, solution.temps)
+        if jump_tol is None:
+            solution = yield from self._gen_steps(
+                rising, ascending, delta, None, solution
+            )
+            yield from self._gen_steps(
+                falling, descending, -delta, None, solution
+            )
+        else:
+            solution = yield from self._gen_refined(
+                rising, ascending, delta, solution, jump_tol, min_step
+            )
+            yield from self._gen_refined(
+                falling, descending, -delta, solution, jump_tol, min_step
+            )
+
+    def gen_temp_blocks(
+        self,
+        min_solar_mult: float,
+        max_solar_mult: float,
+        initial_gat: float,
+        num_lat_zones: int,
+        lat_transfer_coeff: float = 7.6,
+        num_solar_mults: int = 10,
+        block_size: int = 64,
+        jump_tol: float | None = None,
+        min_step: float | None = None,
+    ) -> ResultBlockGen:
+        """
+        Generate the same results as gen_temps, in blocks of up to
+        block_size results.  Each block is a structured array with dtype
+        result_dtype(num_lat_zones).
+        Results are computed only as blocks are requested, so a slow
+        consumer holds back the model.  Sending a block size, instead of
+        None, changes the size of subsequent blocks.
+        """
+        dtype = result_dtype(num_lat_zones)
+        block = np.empty(self._block_size(block_size), dtype)
+        i = 0
+        for result in self.gen_temps(
+            min_solar_mult,
+            max_solar_mult,
+            initial_gat,
+            num_lat_zones,
+            lat_transfer_coeff,
+            num_solar_mults,
+            jump_tol,
+            min_step,
+        ):
+            solution = result.solution
+            block[i] = (
+                result.delta,
+                result.solar_mult,
+                solution.avg,
+                solution.temps,
+                solution.albedos,
+            )
+            i += 1
+            if i == len(block):
+                new_size = yield block
+                if new_size is not None:
+                    block_size = self._block_size(new_size)
+                block = np.empty(block_size, dtype)
+                i = 0
+        if i > 0:
+            yield block[:i]
+
+    def reusable_results(
+        self,
+        previous: list[AvgTempResult],
+        min_solar_mult: float,
+        max_solar_mult: float,
+        num_lat_zones: int,
+        num_solar_mults: int = 10,
+    ) -> list[AvgTempResult]:
+        """
+        Get the results from a previous sweep which are still valid for
+        a sweep from min_solar_mult to max_solar_mult.
+        previous must come from gen_temps, without jump_tol, for the same
+        initial temperature and lateral heat transfer coefficient.
+        The rising branch depends only on where it starts, so if
+        min_solar_mult is unchanged its results below max_solar_mult
+        remain valid.  The falling branch starts from the end of the
+        rising branch, so none of its results are reused.
+        Results are reused only if their step divides the new range into
+        roughly num_solar_mults steps, or up to twice as many, so that
+        the resolution of a sweep stays close to what was asked for.
+        """
+        rising = [r for r in previous if r.delta > 0]
+        if not rising:
+            return []
+        delta = rising[0].delta
+        ascending = np.arange(min_solar_mult, max_solar_mult, delta)
+        num_steps = len(ascending)
+        if not (
+            self._MIN_STEP_COUNT * num_solar_mults
+            <= num_steps
+            <= self._MAX_STEP_COUNT * num_solar_mults
+        ):
+            return []
+        result = []
+        for r, mult in zip(rising, ascending):
+            if (
+                r.delta != delta
+                or len(r.solution.temps) != num_lat_zones
+                or not np.isclose(r.solar_mult, mult)
+            ):
+                break
+            result.append(r)
+        return result
+
+    def extend_temps(
+        self,
+        previous: list[AvgTempResult],
+        min_solar_mult: float,
+        max_solar_mult: float,
+        initial_gat: float,
+        num_lat_zones: int,
+        lat_transfer_coeff: float = 7.6,
+        num_solar_mults: int = 10,
+    ) -> ResultGen:
+        """
+        Generate only the results which a sweep from min_solar_mult to
+        max_solar_mult needs beyond reusable_results(previous, ...).
+        The rising branch resumes from its last reusable result, using
+        the previous step size; the falling branch is recomputed from
+        max_solar_mult.  If nothing can be reused this is the same as
+        gen_temps.
+        """
+        kept = self.reusable_results(
+            previous,
+            min_solar_mult,
+            max_solar_mult,
+            num_lat_zones,
+            num_solar_mults,
+        )
+        if not kept:
+            yield from self.gen_temps(
+                min_solar_mult,
+                max_solar_mult,
+                initial_gat,
+                num_lat_zones,
+                lat_transfer_coeff,
+                num_solar_mults,
+            )
+            return
+
+        delta = kept[0].delta
+        ascending = np.arange(min_solar_mult, max_solar_mult, delta)
+        descending = np.arange(max_solar_mult, min_solar_mult, -delta)
+
+        rising, falling = self._branch_solvers(
+            min_solar_mult,
+            max_solar_mult,
+            initial_gat,
+            num_lat_zones,
+            lat_transfer_coeff,
+        )
+        last = kept[-1]
+        num_kept = len(kept)
+        resumed = ascending[num_kept:]
+        solution = yield from self._gen_steps(
+            rising, resumed, delta, last.solar_mult, last.solution
+        )
+        yield from self._gen_steps(
+            falling, descending, -delta, None, solution
+        )
+
+    def solve_at(
+        self,
+        start: AvgTempResult,
+        solar_mult: float,
+        min_solar_mult: float,
+        max_solar_mult: float,
+        initial_gat: float,
+        num_lat_zones: int,
+        lat_transfer_coeff: float = 7.6,
+    ) -> AvgTempResult:
+        """
+        Solve for solar_mult on the branch of start, a result from a
+        sweep with the given parameters.  start must be behind
+        solar_mult on its branch: at or below it on the rising branch,
+        at or above it on the falling branch.  The solution starts from
+        start, or from a closer cached solution on the branch.
+        """
+        rising = start.delta > 0
+        step = solar_mult - start.solar_mult
+        if step == 0.0:
+            return start
+        if (step > 0.0) != rising:
+            raise ValueError(
+                f"{start.solar_mult} is not behind {solar_mult} on the "
+                f"{'rising' if rising else 'falling'} branch."
+            )
+
+        solvers = self._branch_solvers(
+            min_solar_mult,
+            max_solar_mult,
+            initial_gat,
+            num_lat_zones,
+            lat_transfer_coeff,
+        )
+        solver = solvers[0] if rising else solvers[1]
+        solution = solver.solve(solar_mult, start.solar_mult, start.solution)
+        return AvgTempResult(step, solar_mult, solution)
+
+    def _block_size(self, block_size: int) -> int:
+        if block_size < 1:
+            raise ValueError(f"Block size must be positive: {block_size}")
+        return block_size
+
+    def _branch_solvers(
+        self,
+        min_solar_mult: float,
+        max_solar_mult: float,
+        initial_gat: float,
+        num_lat_zones: int,
+        lat_transfer_coeff: float,
+    ) -> tuple[_BranchSolver, _BranchSolver]:
+        # Get solvers for the rising and falling branches of a sweep.
+        em = cached_earth_model(num_lat_zones)
+        solver = TempSolver(em, lat_transfer_coeff)
+
+        def branch(rising: bool) -> _BranchSolver:
+            key = BranchKey(
+                num_lat_zones,
+                lat_transfer_coeff,
+                rising,
+                initial_gat,
+                min_solar_mult,
+                None if rising else max_solar_mult,
+            )
+            return _BranchSolver(solver, self._cache, key)
+
+        return (branch(True), branch(False))
+
+    def _gen_steps(
+        self,
+        solver: _BranchSolver,
+        mults: np.ndarray,
+        delta: float,
+        prev_mult: float | None,
+        solution: Solution,
+    ) -> tp.Generator[AvgTempResult, None, Solution]:
+        # Generate results for mults, starting from solution (the result
+        # for prev_mult, if any).  Return the last solution.
+        for mult in mults:
+            solution = solver.solve(mult, prev_mult, solution)
             yield AvgTempResult(delta, mult, solution)
+            prev_mult = mult
+        return solution
+
+    def _gen_refined(
+        self,
+        solver: _BranchSolver,
+        mults: np.ndarray,
+        delta: float,
+        solution: Solution,
+        jump_tol: float,
+        min_step: float,
+    ) -> tp.Generator[AvgTempResult, None, Solution]:
+        # Generate results for mults, subdividing each step across
+        # which the global average temperature jumps by more than
+        # jump_tol.  Return the last solution.
+        if len(mults) == 0:
+            return solution
 
-        for mult in descending:
-            solution = solver.solve(mult, solution.temps)
-            yield AvgTempResult(-delta, mult, solution)
+        solution = solver.solve(mults[0], None, solution)
+        yield AvgTempResult(delta, mults[0], solution)
+
+        prev_mult = mults[0]
+        for mult in mults[1:]:
+            solution = yield from self._gen_interval(
+                solver, prev_mult, mult, solution, jump_tol, min_step
+            )
+            prev_mult = mult
+        return solution
+
+    def _gen_interval(
+        self,
+        solver: _BranchSolver,
+        mult0: float,
+        mult1: float,
+        solution0: Solution,
+        jump_tol: float,
+        min_step: float,
+    ) -> tp.Generator[AvgTempResult, None, Solution]:
+        # Step from mult0, where the solution is solution0, to mult1.
+        # Each result's delta is the step that led to it.
+        solution1 = solver.solve(mult1, mult0, solution0)
+        jump = abs(solution1.avg - solution0.avg)
+        half_step = (mult1 - mult0) / 2.0
+        if jump > jump_tol and abs(half_step) >= min_step:
+            # Solutions depend on the path taken, so re-solve at mult1
+            # starting from the midpoint.
+            mid = mult0 + half_step
+            solution_mid = yield from self._gen_interval(
+                solver, mult0, mid, solution0, jump_tol, min_step
+            )
+            return (
+                yield from self._gen_interval(
+                    solver, mid, mult1, solution_mid, jump_tol, min_step
+                )
+            )
+        yield AvgTempResult(mult1 - mult0, mult1, solution1)
+        return solution1
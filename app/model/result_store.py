@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Provides a way to save sweep results to disk and load them again.
+"""
+
+import json
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+
+from .model import ResultTable
+
+
+class ResultStore:
+    """
+    Stores a series of results in a directory.  header.json records the
+    format version, the number of latitude bands and any parameters
+    supplied by the caller.  Each ResultTable column is kept in its own
+    file of raw little-endian values, so results can be appended as they
+    arrive and loaded as memory maps without parsing.
+    """
+
+    VERSION = 2
+    _HEADER_FILE = "header.json"
+    # Column name, dtype and whether there is a value per latitude band:
+    _COLUMNS = [
+        ("deltas", "<f8", False),
+        ("solar_mults", "<f8", False),
+        ("avgs", "<f8", False),
+        ("temps", "<f8", True),
+        ("ice_levels", "|u1", True),
+    ]
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open an existing store.  Use create to make a new one.
+        """
+        self._path = Path(path)
+        header = json.loads((self._path / self._HEADER_FILE).read_text())
+        if header["version"] != self.VERSION:
+            raise ValueError(
+                f"{self._path} has unsupported version {header['version']}."
+            )
+        self._num_lat_zones: int = header["num_lat_zones"]
+        self._params: dict[str, tp.Any] = header["params"]
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        num_lat_zones: int,
+        params: dict[str, tp.Any] | None = None,
+    ) -> "ResultStore":
+        """
+        Create an empty store in a new directory.  params, e.g. the
+        arguments of the sweep, must be JSON-serializable.
+        """
+        path = Path(path)
+        path.mkdir(parents=True)
+        for name, _, _ in cls._COLUMNS:
+            (path / f"{name}.bin").touch()
+        header = {
+            "version": cls.VERSION,
+            "num_lat_zones": num_lat_zones,
+            "params": params or {},
+            "columns": [
+                {"name": name, "dtype": dtype, "per_band": per_band}
+                for name, dtype, per_band in cls._COLUMNS
+            ],
+        }
+        # Write the header last, to mark the store as initialized.
+        (path / cls._HEADER_FILE).write_text(json.dumps(header, indent=2))
+        return cls(path)
+
+    @property
+    def num_lat_zones(self) -> int:
+        return self._num_lat_zones
+
+    @property
+    def params(self) -> dict[str, tp.Any]:
+        return self._params
+
+    def __len__(self) -> int:
+        # If an append was interrupted, some columns may be longer than
+        # others.  Only complete rows count.
+        return min(
+            self._column_path(column[0]).stat().st_size
+            // self._row_size(column)
+            for column in self._COLUMNS
+        )
+
+    def append(self, results: ResultTable) -> None:
+        """Append results to the store."""
+        if results.num_lat_zones != self._num_lat_zones:
+            raise ValueError(
+                f"Expected {self._num_lat_zones} latitude bands, "
+                f"got {results.num_lat_zones}."
+            )
+        num_rows = len(self)
+        for column in self._COLUMNS:
+            name, dtype, _ = column
+            path = self._column_path(name)
+            with path.open("r+b") as outf:
+                # Discard any partial rows from an interrupted append.
+                outf.truncate(num_rows * self._row_size(column))
+                outf.seek(0, 2)
+                values = np.ascontiguousarray(
+                    getattr(results, name), dtype=dtype
+                )
+                outf.write(values.tobytes())
+
+    def load(self) -> ResultTable:
+        """
+        Load the results as a table backed by read-only memory maps.
+        Only the pages which are read are brought into memory.
+        """
+        num_rows = len(self)
+        arrays = []
+        for name, dtype, per_band in self._COLUMNS:
+            shape: tuple[int, ...] = (num_rows,)
+            if per_band:
+                shape = (num_rows, self._num_lat_zones)
+            if num_rows == 0:
+                # np.memmap can't map an empty file.
+                arrays.append(np.empty(shape, dtype=dtype))
+            else:
+                arrays.append(
+                    np.memmap(
+                        self._column_path(name),
+                        dtype=dtype,
+                        mode="r",
+                        shape=shape,
+                    )
+                )
+        return ResultTable.from_arrays(*arrays)
+
+    def _column_path(self, name: str) -> Path:
+        return self._path / f"{name}.bin"
+
+    def _row_size(self, column: tuple[str, str, bool]) -> int:
+        _, dtype, per_band = column
+        size = np.dtype(dtype).itemsize
+        return size * self._num_lat_zones if per_band else size
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Provides a memory-bounded cache of solutions from previous sweeps.
+"""
+
+import bisect
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .temp_solver import Solution
+
+
+@dataclass(frozen=True)
+class BranchKey:
+    """
+    Identifies one branch of a hysteresis sweep.  A rising branch starts
+    at min_solar_mult from initial_gat; it does not depend on
+    max_solar_mult, which should be None.  A falling branch starts at
+    max_solar_mult from the end of the rising branch.
+    """
+
+    num_lat_zones: int
+    lat_transfer_coeff: float
+    rising: bool
+    initial_gat: float
+    min_solar_mult: float
+    max_solar_mult: float | None
+
+
+class SolutionCache:
+    """
+    Caches solutions by branch and solar multiplier, evicting the least
+    recently used solutions to stay within a memory budget.
+    Safe to share across threads.
+    """
+
+    # Solar multipliers are rounded to this many decimal places, so that
+    # sweeps which reach the same value by different arithmetic share
+    # cache entries.
+    _DECIMALS = 10
+    # Rough per-entry overhead, bytes, beyond the size of the arrays:
+    _ENTRY_OVERHEAD = 256
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[
+            tuple[BranchKey, float], Solution
+        ] = OrderedDict()
+        # Sorted solar multipliers cached for each branch:
+        self._mults: dict[BranchKey, list[float]] = {}
+        self._num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def num_bytes(self) -> int:
+        return self._num_bytes
+
+    def get(self, branch: BranchKey, solar_mult: float) -> Solution | None:
+        """Get the cached solution for solar_mult on branch, if any."""
+        key = (branch, self._round(solar_mult))
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return result
+
+    def nearest_behind(
+        self, branch: BranchKey, solar_mult: float
+    ) -> tuple[float, Solution] | None:
+        """
+        Get the cached solution on branch whose solar multiplier is
+        nearest solar_mult, on the side from which the branch
+        approaches it: below for a rising branch, above for a falling
+        branch.  Solving from there follows the branch.
+        """
+        mult = self._round(solar_mult)
+        with self._lock:
+            mults = self._mults.get(branch)
+            if not mults:
+                return None
+            if branch.rising:
+                i = bisect.bisect_right(mults, mult) - 1
+                if i < 0:
+                    return None
+            else:
+                i = bisect.bisect_left(mults, mult)
+                if i >= len(mults):
+                    return None
+            found = mults[i]
+            key = (branch, found)
+            self._entries.move_to_end(key)
+            return (found, self._entries[key])
+
+    def put(
+        self, branch: BranchKey, solar_mult: float, solution: Solution
+    ) -> None:
+        mult = self._round(solar_mult)
+        key = (branch, mult)
+        with self._lock:
+            if key in self._entries:
+                self._num_bytes -= self._size(self._entries[key])
+            else:
+                bisect.insort(self._mults.setdefault(branch, []), mult)
+            self._entries[key] = solution
+            self._entries.move_to_end(key)
+            self._num_bytes += self._size(solution)
+
+            while self._num_bytes > self._max_bytes and self._entries:
+                (old_branch, old_mult), old = self._entries.popitem(
+                    last=False
+                )
+                self._num_bytes -= self._size(old)
+                mults = self._mults[old_branch]
+                mults.pop(bisect.bisect_left(mults, old_mult))
+                if not mults:
+                    del self._mults[old_branch]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._mults.clear()
+            self._num_bytes = 0
+
+    def _round(self, solar_mult: float) -> float:
+        return round(float(solar_mult), self._DECIMALS)
+
+    def _size(self, solution: Solution) -> int:
+        return (
+            solution.temps.nbytes
+            + solution.albedos.nbytes
+            + self._ENTRY_OVERHEAD
+        )
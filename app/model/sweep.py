@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Provides a way to run many independent hysteresis sweeps in parallel.
+"""
+
+import functools
+import math
+import os
+import typing as tp
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .model import Model, ResultTable
+from .sweep_cache import SweepCache
+
+
+@dataclass(frozen=True)
+class SweepCase:
+    """Parameters for one hysteresis sweep."""
+
+    num_lat_zones: int
+    lat_transfer_coeff: float
+    initial_gat: float
+
+
+@dataclass
+class SweepResult:
+    case: SweepCase
+    results: ResultTable
+
+
+class SweepRunner:
+    """
+    Runs Model.gen_temps for many cases across a pool of processes.
+    """
+
+    def __init__(
+        self,
+        min_solar_mult: float,
+        max_solar_mult: float,
+        num_solar_mults: int = 10,
+        max_workers: int | None = None,
+        chunksize: int | None = None,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """
+        Initialize a new instance.
+        max_workers caps the number of worker processes; it defaults to
+        the number of CPUs.  Cases are sent to workers in chunks of
+        chunksize, to limit pickling overhead.  By default each worker
+        gets about four chunks.
+        If cache_dir is given, finished sweeps are cached there and
+        reused by later runs.
+        """
+        self._min_solar_mult = min_solar_mult
+        self._max_solar_mult = max_solar_mult
+        self._num_solar_mults = num_solar_mults
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunksize = chunksize
+        self._cache_dir = cache_dir
+
+    def run(self, cases: tp.Iterable[SweepCase]) -> list[SweepResult]:
+        """Run all cases.  Results are in the same order as cases."""
+        cases = list(cases)
+        args = [
+            (
+                case,
+                self._min_solar_mult,
+                self._max_solar_mult,
+                self._num_solar_mults,
+                self._cache_dir,
+            )
+            for case in cases
+        ]
+        if self._max_workers == 1 or len(cases) <= 1:
+            return [_run_case(a) for a in args]
+
+        num_workers = min(self._max_workers, len(cases))
+        chunksize = self._chunksize or math.ceil(
+            len(cases) / (4 * num_workers)
+        )
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            return list(executor.map(_run_case, args, chunksize=chunksize))
+
+
+def _run_case(
+    args: tuple[SweepCase, float, float, int, Path | None]
+) -> SweepResult:
+    # Runs in a worker process, so it must be a module-level function.
+    case, min_solar_mult, max_solar_mult, num_solar_mults, cache_dir = args
+    model = Model()
+    gen_temps = model.gen_temps
+    if cache_dir is not None:
+        gen_temps = functools.partial(SweepCache(cache_dir).gen_temps, model)
+    results = gen_temps(
+        min_solar_mult,
+        max_solar_mult,
+        case.initial_gat,
+        case.num_lat_zones,
+        case.lat_transfer_coeff,
+        num_solar_mults=num_solar_mults,
+    )
+    return SweepResult(
+        case, ResultTable.from_results(case.num_lat_zones, results)
+    )
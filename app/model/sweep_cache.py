@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Provides a disk cache of finished sweeps, shared between processes.
+"""
+
+import functools
+import hashlib
+import json
+import numbers
+import os
+import shutil
+import typing as tp
+import uuid
+from pathlib import Path
+
+from .model import Model, ResultGen, ResultTable
+from .result_store import ResultStore
+
+# Source files whose contents determine sweep results:
+_MODEL_SOURCES = [
+    "earth_model.py",
+    "temp_solver.py",
+    "model.py",
+    "solution_cache.py",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def code_version() -> str:
+    """Get a digest of the model source code."""
+    digest = hashlib.sha256()
+    for name in _MODEL_SOURCES:
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()
+
+
+class SweepCache:
+    """
+    Caches finished sweeps in a directory, keyed by a hash of the sweep
+    parameters and the model source code.  Each entry is a ResultStore.
+    Entries are written to a temporary directory and renamed into place,
+    so several processes can share a cache directory.  When the cache
+    grows beyond max_bytes the least recently used entries are removed.
+    """
+
+    # Prefix for entries which are being written or removed:
+    _TMP_PREFIX = ".tmp-"
+
+    def __init__(
+        self, cache_dir: Path, max_bytes: int = 1024 * 1024 * 1024
+    ) -> None:
+        self._dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, params: dict[str, tp.Any]) -> str:
+        """Get the cache key for a sweep with the given parameters."""
+        text = json.dumps(
+            {
+                "params": self._normalized(params),
+                "code_version": code_version(),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def get(self, params: dict[str, tp.Any]) -> ResultTable | None:
+        """Get the cached results for params, if any."""
+        path = self._dir / self.key(params)
+        try:
+            results = ResultStore(path).load()
+            # Mark the entry as recently used.
+            os.utime(path)
+        except (OSError, ValueError):
+            # Missing, or removed by another process while loading.
+            return None
+        return results
+
+    def put(self, params: dict[str, tp.Any], results: ResultTable) -> None:
+        """Cache results for params, then evict entries if needed."""
+        path = self._dir / self.key(params)
+        tmp_path = self._tmp_path()
+        store = ResultStore.create(
+            tmp_path, results.num_lat_zones, self._normalized(params)
+        )
+        store.append(results)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # Another process cached the same sweep first.
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        self._evict()
+
+    def gen_temps(
+        self,
+        model: Model,
+        min_solar_mult: float,
+        max_solar_mult: float,
+        initial_gat: float,
+        num_lat_zones: int,
+        lat_transfer_coeff: float = 7.6,
+        num_solar_mults: int = 10,
+    ) -> ResultGen:
+        """
+        Generate the same results as model.gen_temps, from the cache if
+        possible.  Otherwise the results are cached once all have been
+        generated.
+        """
+        params = {
+            "min_solar_mult": min_solar_mult,
+            "max_solar_mult": max_solar_mult,
+            "initial_gat": initial_gat,
+            "num_lat_zones": num_lat_zones,
+            "lat_transfer_coeff": lat_transfer_coeff,
+            "num_solar_mults": num_solar_mults,
+        }
+        cached = self.get(params)
+        if cached is not None:
+            yield from cached
+            return
+
+        results = ResultTable(num_lat_zones)
+        for result in model.gen_temps(**params):
+            results.append(result)
+            yield result
+        self.put(params, results)
+
+    def _normalized(self, params: dict[str, tp.Any]) -> dict[str, tp.Any]:
+        # Numbers are compared as floats, so that e.g. 4, 4.0 and
+        # np.float64(4) give the same key.
+        return {
+            name: (
+                float(value)
+                if isinstance(value, numbers.Real)
+                and not isinstance(value, bool)
+                else value
+            )
+            for name, value in params.items()
+        }
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._dir.iterdir():
+            if path.name.startswith(self._TMP_PREFIX):
+                continue
+            try:
+                mtime = path.stat().st_mtime
+                size = sum(p.stat().st_size for p in path.iterdir())
+            except OSError:
+                continue
+            entries.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_bytes:
+                break
+            # Rename first, so that readers never see a partial entry.
+            tmp_path = self._tmp_path()
+            try:
+                os.rename(path, tmp_path)
+            except OSError:
+                # Another process removed it.
+                continue
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            total -= size
+
+    def _tmp_path(self) -> Path:
+        return self._dir / f"{self._TMP_PREFIX}{uuid.uuid4().hex}"
@@ -3,6 +3,7 @@
 Provides a way to solve iteratively for latitudinal temperature.
 """
 
+import typing as tp
 from dataclasses import dataclass
 
 import numpy as np
@@ -10,6 +11,9 @@ import numpy as np
 from .earth_model import EarthModel
 
 
+Accel = tp.Literal["none", "aitken", "anderson"]
+
+
 class Error(Exception):
     pass
 
@@ -21,44 +25,486 @@ class Solution:
     avg: float
 
 
+@dataclass(frozen=True)
+class BatchSolution:
+    """
+    Solutions for many independent cases.  temps and albedos have one row
+    per case; avgs and converged have one value per case.  Cases which
+    did not converge hold their last iterates.
+    """
+
+    temps: np.ndarray
+    albedos: np.ndarray
+    avgs: np.ndarray
+    converged: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.avgs)
+
+    def __getitem__(self, i: int) -> Solution:
+        return Solution(self.temps[i], self.albedos[i], float(self.avgs[i]))
+
+
+@dataclass(frozen=True)
+class Linearization:
+    """
+    The equilibrium equations F(temps, solar_mult) = 0, linearized about
+    a set of temperatures.  resid is F.  The Jacobian with respect to
+    temps is diag(diag) - lat_transfer_coeff * outer(ones, lats_frac),
+    and d_solar_mult is the derivative with respect to solar_mult.
+    """
+
+    resid: np.ndarray
+    diag: np.ndarray
+    d_solar_mult: np.ndarray
+    lats_frac: np.ndarray
+    lat_transfer_coeff: float
+
+    @property
+    def stable(self) -> bool:
+        """
+        True if the Jacobian is positive definite in the
+        lats_frac-weighted inner product, i.e. if small disturbances
+        of an equilibrium at temps die away.
+        """
+        if np.any(self.diag <= 0.0):
+            return False
+        z = self.lat_transfer_coeff / self.diag
+        return bool(1.0 - self.lats_frac @ z > 0.0)
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        """
+        Solve Jacobian @ x = rhs in O(num_zones), using the
+        Sherman-Morrison formula.  Pivots which are (nearly) zero are
+        clamped, so that the result stays finite at folds.
+        """
+        eps = 1.0e-12 * np.max(np.abs(self.diag))
+        diag = np.where(np.abs(self.diag) < eps, eps, self.diag)
+        y = rhs / diag
+        z = self.lat_transfer_coeff / diag
+        sm_denom = 1.0 - self.lats_frac @ z
+        if abs(sm_denom) < eps:
+            sm_denom = eps
+        return y + z * ((self.lats_frac @ y) / sm_denom)
+
+
 class TempSolver:
+    # Radiative heat-loss coefficients, intercept and slope:
+    _A = 204.0
+    _B = 2.17
+    # We're done when max_temp_diff reaches this threshold.
+    _THRESHOLD = 0.05
+    # Number of previous iterates used for Anderson mixing.
+    _ANDERSON_DEPTH = 5
+    # Albedos of ice and land, and the critical temperature, C,
+    # below which all is ice:
+    ICE_ALBEDO = 0.6
+    LAND_ALBEDO = 0.3
+    _T_CRIT = -10.0
+
+    # Maximum number of times a Newton step is halved while searching
+    # for a smaller residual.
+    _MAX_HALVINGS = 2
+
     def __init__(
-        self, earth_model: EarthModel, lat_transfer_coeff: float = 7.6
+        self,
+        earth_model: EarthModel,
+        lat_transfer_coeff: float = 7.6,
+        albedo_width: float = 0.0,
     ) -> None:
+        """
+        Initialize a new instance.
+        albedo_width, C, is the width of a smooth (tanh) transition from
+        ice to land albedo around the critical temperature.  Zero gives
+        the model's step change in albedo.
+        """
+        if albedo_width < 0.0:
+            raise ValueError(f"albedo_width must be >= 0: {albedo_width}")
         self._em = earth_model
         # Latitude band heat transfer coefficient, W/m**2:
         self._lat_transfer_coeff = lat_transfer_coeff
+        self._albedo_width = albedo_width
 
     def solve(
-        self, solar_mult: float, temp: np.ndarray, max_iter: int = 100
+        self,
+        solar_mult: float,
+        temp: np.ndarray,
+        max_iter: int = 100,
+        accel: Accel = "none",
+        damping: float = 1.0,
     ) -> Solution:
         """
         Solve for temperatures and albedos by latitude band.
         Return the computed average planetary temperature.
+
+        accel selects a scheme to speed up the fixed-point iteration:
+        "aitken" for vector Aitken extrapolation, or "anderson" for
+        Anderson mixing.  damping, in (0, 1], is the fraction of each
+        fixed-point update that is applied; smaller values are slower
+        but more stable.  Accelerated steps are used only while they
+        shrink the residual and keep the ice cover of a plain step, so
+        they find the same equilibrium as plain iteration.
         """
-        threshold = 0.05  # We're done when max_temp_diff reaches this thresh.
+        if not 0.0 < damping <= 1.0:
+            raise ValueError(f"damping must be in (0, 1]: {damping}")
+        if accel not in ("none", "aitken", "anderson"):
+            raise ValueError(f"Unknown acceleration scheme: {accel}")
+
         m_insol = solar_mult * self._em.insol_by_lat
+        # Iterates and residuals for Aitken extrapolation and Anderson
+        # mixing.
+        temps: list[np.ndarray] = []
+        resids: list[np.ndarray] = []
+        # Ice cover of the iterates in temps:
+        ice: np.ndarray | None = None
+        # The iterate and residual from which the last accelerated step
+        # was taken, if the last step was accelerated:
+        accel_from: tuple[np.ndarray, np.ndarray] | None = None
+
+        for _i in range(max_iter):
+            temp_next, albedo, temp_avg = self._update(m_insol, temp)
+            resid = temp_next - temp
+            err = np.max(np.abs(resid))
+            if err <= self._THRESHOLD:
+                return Solution(temp_next, albedo, temp_avg)
+
+            if accel_from is not None:
+                prev_temp, prev_resid = accel_from
+                accel_from = None
+                if err > np.max(np.abs(prev_resid)):
+                    # The accelerated step made things worse.  Take a
+                    # damped fixed-point step instead, and start over.
+                    temp = prev_temp + damping * prev_resid
+                    temps, resids, ice = [], [], None
+                    continue
+
+            # The equations change when the ice edge moves, so earlier
+            # iterates no longer predict later ones.
+            temp_ice = temp <= self._T_CRIT
+            if ice is None or not np.array_equal(temp_ice, ice):
+                temps, resids, ice = [], [], temp_ice
+
+            plain = temp + damping * resid
+            if accel == "anderson":
+                temps.append(temp)
+                resids.append(resid)
+                del temps[: -self._ANDERSON_DEPTH - 1]
+                del resids[: -self._ANDERSON_DEPTH - 1]
+                candidate = self._anderson_step(temps, resids, damping)
+            elif accel == "aitken":
+                temps.append(temp)
+                candidate = plain
+                if len(temps) == 2:
+                    candidate = self._aitken_step(temps[0], temps[1], plain)
+                    temps = []
+            else:
+                candidate = plain
+
+            # Near a tipping point an extrapolated step can cross the
+            # ice edge that plain iteration would not, and settle on
+            # another equilibrium.  Only accept steps which keep the
+            # same ice cover as the plain step.
+            if candidate is plain or not np.array_equal(
+                candidate <= self._T_CRIT, plain <= self._T_CRIT
+            ):
+                temp = plain
+            else:
+                accel_from = (temp, resid)
+                temp = candidate
+        raise Error(f"Failed to converge after {max_iter} iterations.")
+
+    @staticmethod
+    def _aitken_step(
+        t0: np.ndarray, t1: np.ndarray, t2: np.ndarray
+    ) -> np.ndarray:
+        # Vector (Irons-Tuck) form of Aitken's delta-squared extrapolation.
+        d1 = t2 - t1
+        d2 = d1 - (t1 - t0)
+        d2_sq = d2 @ d2
+        if d2_sq == 0.0:
+            return t2
+        return t2 - ((d1 @ d2) / d2_sq) * d1
+
+    @staticmethod
+    def _anderson_step(
+        temps: list[np.ndarray], resids: list[np.ndarray], damping: float
+    ) -> np.ndarray:
+        # Anderson mixing: choose the combination of recent iterates
+        # whose combined residual is smallest, then take a damped
+        # fixed-point step from there.
+        temp = temps[-1]
+        resid = resids[-1]
+        if len(temps) == 1:
+            return temp + damping * resid
+        d_temps = np.diff(temps, axis=0).T
+        d_resids = np.diff(resids, axis=0).T
+        gamma = np.linalg.lstsq(d_resids, resid, rcond=None)[0]
+        return temp + damping * resid - (d_temps + damping * d_resids) @ gamma
+
+    def _update(
+        self, m_insol: np.ndarray, temp: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, float]:
+        # Apply one fixed-point update to temp.  Return the new temps,
+        # and the albedos and global average temperature of temp.
         f = self._lat_transfer_coeff
-        a = 204.0  # Radiative heat-loss coefficient, intercept
-        b = 2.17  # Radiative heat-loss coefficient, slope
-        denom = b + f
+        albedo = self._get_albedo(temp)
+        temp_avg = self._em.lats_frac @ temp
+        temp_next = (m_insol * (1.0 - albedo) + f * temp_avg - self._A) / (
+            self._B + f
+        )
+        return (temp_next, albedo, temp_avg)
+
+    def solve_batch(
+        self,
+        solar_mults: np.ndarray | float,
+        temps: np.ndarray,
+        lat_transfer_coeffs: np.ndarray | float | None = None,
+        max_iter: int = 100,
+        raise_on_failure: bool = True,
+    ) -> BatchSolution:
+        """
+        Solve many independent cases in one vectorized iteration.
+        temps is an (n_cases, num_zones) array of initial temperatures.
+        solar_mults and lat_transfer_coeffs give one value per case, or a
+        single value shared by all cases.  lat_transfer_coeffs defaults to
+        self's coefficient.  Each case stops iterating as soon as it
+        converges.  If any case fails to converge, Error is raised;
+        unless raise_on_failure is False, in which case the result's
+        converged mask shows which cases failed.
+        """
+        temps = np.array(temps, dtype=float, ndmin=2)
+        n_cases = temps.shape[0]
+        mults = np.broadcast_to(np.asarray(solar_mults, dtype=float), n_cases)
+        if lat_transfer_coeffs is None:
+            lat_transfer_coeffs = self._lat_transfer_coeff
+        coeffs = np.broadcast_to(
+            np.asarray(lat_transfer_coeffs, dtype=float), n_cases
+        )
+
+        albedos = np.empty_like(temps)
+        avgs = np.empty(n_cases)
+        converged = np.ones(n_cases, dtype=bool)
 
+        # Working arrays hold only the cases which have not yet converged.
+        active = np.arange(n_cases)
+        temp = temps
+        m_insol = mults[:, None] * self._em.insol_by_lat
+        f = coeffs
+        denom = self._B + f
         for _i in range(max_iter):
-            temp_old = temp
             albedo = self._get_albedo(temp)
-            temp_avg = sum(self._em.lats_frac * temp)
-            temp = (m_insol * (1.0 - albedo) + f * temp_avg - a) / denom
-            max_temp_diff = max(abs(temp_old - temp))
+            temp_avg = temp @ self._em.lats_frac
+            temp_new = (
+                m_insol * (1.0 - albedo) + (f * temp_avg - self._A)[:, None]
+            ) / denom[:, None]
+            done = np.max(np.abs(temp_new - temp), axis=1) <= self._THRESHOLD
+
+            if np.any(done):
+                finished = active[done]
+                temps[finished] = temp_new[done]
+                albedos[finished] = albedo[done]
+                avgs[finished] = temp_avg[done]
+
+                keep = ~done
+                active = active[keep]
+                if active.size == 0:
+                    return BatchSolution(temps, albedos, avgs, converged)
+                temp_new = temp_new[keep]
+                m_insol = m_insol[keep]
+                f = f[keep]
+                denom = denom[keep]
+            temp = temp_new
 
-            if max_temp_diff <= threshold:
-                return Solution(temp, albedo, temp_avg)
+        if raise_on_failure:
+            raise Error(
+                f"{active.size} of {n_cases} cases failed to converge "
+                f"after {max_iter} iterations."
+            )
+        temps[active] = temp
+        albedos[active] = self._get_albedo(temp)
+        avgs[active] = temp @ self._em.lats_frac
+        converged[active] = False
+        return BatchSolution(temps, albedos, avgs, converged)
+
+    def solve_newton(
+        self, solar_mult: float, temp: np.ndarray, max_iter: int = 50
+    ) -> Solution:
+        """
+        Solve for temperatures and albedos by latitude band using
+        Newton's method, which converges quadratically when albedo is
+        smooth.  The Jacobian is diagonal plus a rank-one term from the
+        global average temperature, so each step costs O(num_zones).
+        """
+        m_insol = solar_mult * self._em.insol_by_lat
+        denom = self._B + self._lat_transfer_coeff
+
+        temp_next, albedo, temp_avg = self._update(m_insol, temp)
+        resid = temp_next - temp
+        err = np.max(np.abs(resid))
+        for _i in range(max_iter):
+            if err <= self._THRESHOLD:
+                return Solution(temp_next, albedo, temp_avg)
+
+            lin = self.linearize(solar_mult, temp)
+            accepted = False
+            if lin.stable:
+                step = lin.solve(denom * resid)
+                # Backtrack until the residual shrinks.
+                scale = 1.0
+                for _j in range(self._MAX_HALVINGS + 1):
+                    trial = temp + scale * step
+                    temp_next, albedo, temp_avg = self._update(m_insol, trial)
+                    trial_resid = temp_next - trial
+                    trial_err = np.max(np.abs(trial_resid))
+                    if trial_err < err:
+                        temp, resid, err = trial, trial_resid, trial_err
+                        accepted = True
+                        break
+                    scale /= 2.0
+            if not accepted:
+                # Far from a stable equilibrium Newton steps can head for
+                # an unstable one, or fail to shrink the residual.  Take
+                # a fixed-point step instead.
+                temp = temp + resid
+                temp_next, albedo, temp_avg = self._update(m_insol, temp)
+                resid = temp_next - temp
+                err = np.max(np.abs(resid))
         raise Error(f"Failed to converge after {max_iter} iterations.")
 
-    def _get_albedo(self, temp: np.ndarray) -> np.ndarray:
-        ice = 0.6
-        land = 0.3
-        t_crit = -10.0  # Critical temp, C, below which all is ice
+    def linearize(self, solar_mult: float, temp: np.ndarray) -> Linearization:
+        """
+        Linearize the equilibrium equations about temp.  The equations
+        are the update formula in solve, rearranged as
+        (b + f) * temp - m_insol * (1 - albedo) - f * temp_avg + a = 0.
+        """
+        f = self._lat_transfer_coeff
+        insol = self._em.insol_by_lat
+        m_insol = solar_mult * insol
+        albedo = self._get_albedo(temp)
+        temp_avg = self._em.lats_frac @ temp
+        denom = self._B + f
+        resid = (
+            denom * temp - m_insol * (1.0 - albedo) - f * temp_avg + self._A
+        )
+        diag = denom + m_insol * self._get_albedo_slope(temp)
+        d_solar_mult = -insol * (1.0 - albedo)
+        return Linearization(resid, diag, d_solar_mult, self._em.lats_frac, f)
 
-        result = np.full_like(temp, ice)
-        result[temp > t_crit] = land
+    def solve_direct(self, solar_mult: float, temp: np.ndarray) -> Solution:
+        """
+        Solve exactly for temperatures and albedos by latitude band.
+        For a fixed set of ice-covered bands the equilibrium is linear, so
+        solve it in closed form, update the ice cover from the result,
+        and repeat until the ice cover is self-consistent.  Once the ice
+        edge is monotone in latitude it can only move in one direction,
+        so this takes at most num_zones + 1 closed-form solves.
+        Requires a step change in albedo.
+        """
+        self._require_step_albedo()
+        m_insol = solar_mult * self._em.insol_by_lat
+        albedo = self._get_albedo(temp)
+        for _i in range(self._em.num_zones + 2):
+            solution = self._linear_solution(m_insol, albedo)
+            albedo = self._get_albedo(solution.temps)
+            if np.array_equal(albedo, solution.albedos):
+                return solution
+        raise Error("Failed to find a self-consistent ice edge.")
+
+    def equilibria(self, solar_mult: float) -> list[Solution]:
+        """
+        Find every exact equilibrium for a solar multiplier, ordered
+        from coldest to warmest.
+        Insolation falls off from equator to pole, so in any equilibrium
+        the ice covers every band poleward of some edge.  Candidate edges
+        are checked all at once using cumulative sums of absorbed
+        insolation, so the cost is O(num_zones) plus one closed-form
+        solve per equilibrium found.  Requires a step change in albedo.
+        """
+        self._require_step_albedo()
+        em = self._em
+        f = self._lat_transfer_coeff
+        m_insol = solar_mult * em.insol_by_lat
+
+        # Area-weighted absorbed insolation, if all land or all ice:
+        land_abs = np.cumsum(
+            em.lats_frac * m_insol * (1.0 - self.LAND_ALBEDO)
+        )
+        ice_abs = np.cumsum(em.lats_frac * m_insol * (1.0 - self.ICE_ALBEDO))
+        land_abs = np.concatenate(([0.0], land_abs))
+        ice_abs = np.concatenate(([0.0], ice_abs))
+
+        # Global average temps when the first num_land bands are ice-free,
+        # for num_land in 0 ... num_zones:
+        total_frac = em.lats_frac.sum()
+        absorbed = land_abs + (ice_abs[-1] - ice_abs)
+        temp_avg = (absorbed - self._A * total_frac) / (
+            self._B + f - f * total_frac
+        )
+
+        # Temperature of the last ice-free band, and of the first icy band:
+        denom = self._B + f
+        shared = f * temp_avg - self._A
+        last_land = np.full_like(temp_avg, np.inf)
+        last_land[1:] = (
+            m_insol * (1.0 - self.LAND_ALBEDO) + shared[1:]
+        ) / denom
+        first_ice = np.full_like(temp_avg, -np.inf)
+        first_ice[:-1] = (
+            m_insol * (1.0 - self.ICE_ALBEDO) + shared[:-1]
+        ) / denom
+
+        candidates = np.flatnonzero(
+            (last_land > self._T_CRIT) & (first_ice <= self._T_CRIT)
+        )
+
+        result = []
+        for num_land in candidates:
+            albedo = np.full(em.num_zones, self.ICE_ALBEDO)
+            albedo[:num_land] = self.LAND_ALBEDO
+            solution = self._linear_solution(m_insol, albedo)
+            if np.array_equal(self._get_albedo(solution.temps), albedo):
+                result.append(solution)
         return result
+
+    def _linear_solution(
+        self, m_insol: np.ndarray, albedo: np.ndarray
+    ) -> Solution:
+        # Solve exactly for the equilibrium temperatures given fixed
+        # albedos.  The global average temperature follows from taking
+        # the area-weighted sum of the update formula in solve.
+        lats_frac = self._em.lats_frac
+        f = self._lat_transfer_coeff
+        absorbed = m_insol * (1.0 - albedo)
+        total_frac = lats_frac.sum()
+        temp_avg = float(
+            (lats_frac @ absorbed - self._A * total_frac)
+            / (self._B + f - f * total_frac)
+        )
+        temp = (absorbed + f * temp_avg - self._A) / (self._B + f)
+        return Solution(temp, albedo, temp_avg)
+
+    def _require_step_albedo(self) -> None:
+        if self._albedo_width > 0.0:
+            raise ValueError("This solver requires albedo_width == 0.")
+
+    def _get_albedo(self, temp: np.ndarray) -> np.ndarray:
+        if self._albedo_width > 0.0:
+            x = (temp - self._T_CRIT) / self._albedo_width
+            return self.LAND_ALBEDO + (
+                self.ICE_ALBEDO - self.LAND_ALBEDO
+            ) * 0.5 * (1.0 - np.tanh(x))
+        result = np.full_like(temp, self.ICE_ALBEDO)
+        result[temp > self._T_CRIT] = self.LAND_ALBEDO
+        return result
+
+    def _get_albedo_slope(self, temp: np.ndarray) -> np.ndarray:
+        # Derivative of albedo with respect to temperature.
+        if self._albedo_width > 0.0:
+            x = (temp - self._T_CRIT) / self._albedo_width
+            scale = (
+                -0.5
+                * (self.ICE_ALBEDO - self.LAND_ALBEDO)
+                / self._albedo_width
+            )
+            return scale * (1.0 - np.tanh(x) ** 2)
+        return np.zeros_like(temp)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Provides a way to locate the solar multipliers at which global average
+temperature jumps, i.e. the climate tipping points.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from .earth_model import cached_earth_model
+from .temp_solver import Solution, TempSolver
+
+
+@dataclass(frozen=True)
+class TippingPoints:
+    """
+    Solar multipliers at which the rising and falling branches jump, or
+    None if a branch has no jump.  min_solar_mult and max_solar_mult
+    bound a window which contains the hysteresis loop.
+    """
+
+    rising: float | None
+    falling: float | None
+    min_solar_mult: float
+    max_solar_mult: float
+
+
+@dataclass
+class _Bracket:
+    # A solar multiplier interval containing a jump, with the solution
+    # on either side.
+    lo_mult: float
+    lo_solution: Solution
+    hi_mult: float
+    hi_solution: Solution
+
+
+class TippingPointLocator:
+    """
+    Locates tipping points by bisecting between warm-started solves.
+    """
+
+    def __init__(
+        self,
+        num_lat_zones: int,
+        lat_transfer_coeff: float = 7.6,
+        jump_tol: float = 10.0,
+    ) -> None:
+        """
+        Initialize a new instance.
+        A change in global average temperature of more than jump_tol
+        between neighboring solar multipliers counts as a jump.
+        """
+        self._num_lat_zones = num_lat_zones
+        self._solver = TempSolver(
+            cached_earth_model(num_lat_zones), lat_transfer_coeff
+        )
+        self._jump_tol = jump_tol
+
+    def locate(
+        self,
+        min_solar_mult: float,
+        max_solar_mult: float,
+        initial_gat: float,
+        tol: float = 1.0e-4,
+        num_solar_mults: int = 20,
+        margin: float = 0.1,
+    ) -> TippingPoints:
+        """
+        Find the tipping points, to within tol, on the rising and falling
+        branches between min_solar_mult and max_solar_mult.
+        A coarse sweep of num_solar_mults steps brackets the biggest jump
+        on each branch; bisection then narrows each bracket.  The
+        returned window extends past the tipping points by margin times
+        the width of the hysteresis loop.
+        """
+        gat0 = np.full(self._num_lat_zones, initial_gat)
+        solution = Solution(gat0, np.zeros_like(gat0), initial_gat)
+
+        ascending = np.linspace(
+            min_solar_mult, max_solar_mult, num_solar_mults + 1
+        )
+        rising, solution = self._bracket_jump(ascending, solution)
+        falling, _ = self._bracket_jump(ascending[::-1], solution)
+
+        rising_mult = None if rising is None else self._bisect(rising, tol)
+        falling_mult = None if falling is None else self._bisect(falling, tol)
+
+        if rising_mult is None or falling_mult is None:
+            return TippingPoints(
+                rising_mult, falling_mult, min_solar_mult, max_solar_mult
+            )
+
+        pad = margin * abs(rising_mult - falling_mult)
+        return TippingPoints(
+            rising_mult,
+            falling_mult,
+            min(rising_mult, falling_mult) - pad,
+            max(rising_mult, falling_mult) + pad,
+        )
+
+    def _bracket_jump(
+        self, mults: np.ndarray, solution: Solution
+    ) -> tuple[_Bracket | None, Solution]:
+        # Sweep through mults.  Return a bracket around the biggest jump,
+        # if any, and the final solution.
+        result = None
+        biggest = self._jump_tol
+        prev_mult = None
+        for mult in mults:
+            prev_solution = solution
+            solution = self._solver.solve(mult, solution.temps)
+            if prev_mult is not None:
+                jump = abs(solution.avg - prev_solution.avg)
+                if jump > biggest:
+                    biggest = jump
+                    result = _Bracket(
+                        prev_mult, prev_solution, mult, solution
+                    )
+            prev_mult = mult
+        return (result, solution)
+
+    def _bisect(self, bracket: _Bracket, tol: float) -> float:
+        # Narrow bracket until it is no wider than tol.  Each solve starts
+        # from the pre-jump side so that it follows the branch.
+        b = bracket
+        while abs(b.hi_mult - b.lo_mult) > tol:
+            mid = (b.lo_mult + b.hi_mult) / 2.0
+            mid_solution = self._solver.solve(mid, b.lo_solution.temps)
+            lo_change = abs(mid_solution.avg - b.lo_solution.avg)
+            hi_change = abs(b.hi_solution.avg - mid_solution.avg)
+            if lo_change > hi_change:
+                b.hi_mult, b.hi_solution = mid, mid_solution
+            else:
+                b.lo_mult, b.lo_solution = mid, mid_solution
+        return (b.lo_mult + b.hi_mult) / 2.0
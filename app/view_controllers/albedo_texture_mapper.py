@@ -3,7 +3,10 @@
 import math
 import shutil
 import tempfile
+import threading
 import typing as tp
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -20,15 +23,32 @@ def _gen_img_ids() -> tp.Generator[str, None, None]:
 class AlbedoTextureMapper:
     """Generates OpenGL texture maps to represent by-latitude albedo."""
 
-    def __init__(self) -> None:
-        """Initialize a new instance."""
-        self._working_dir = Path(tempfile.mkdtemp())
-        self._working_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(self, max_images: int = 256, height: int = 200) -> None:
+        """
+        Initialize a new instance.
+        Up to max_images of the most recently used images are cached.
+        Images are height pixels tall, or one pixel per latitude band if
+        there are more bands than that.
+        """
+        # Image files are written only on request.
+        self._working_dir: Path | None = None
         self._img_ids = _gen_img_ids()
+        self._max_images = max_images
+        self._images: OrderedDict[bytes, QImage] = OrderedDict()
+        self._height = height
+        # Band index for each image row, by number of bands:
+        self._band_rows: dict[int, np.ndarray] = {}
+        # Images may be built on a background thread; see prerender.
+        self._lock = threading.Lock()
+        self._pending: set[bytes] = set()
+        self._executor: ThreadPoolExecutor | None = None
 
     def __del__(self) -> None:
         """Delete this instance and its temporary files."""
-        shutil.rmtree(self._working_dir)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._working_dir is not None:
+            shutil.rmtree(self._working_dir)
 
     def img_path_from_albedos(self, albedos: np.ndarray) -> Path:
         """Get the path of an image build from albedos."""
@@ -36,6 +56,41 @@ class AlbedoTextureMapper:
 
     def img_from_albedos(self, albedos: np.ndarray) -> QImage:
         """Get an image from a sequence of normalized albedo values."""
+        gray_values = self._gray_values(albedos)
+        key = gray_values.tobytes()
+        with self._lock:
+            result = self._images.get(key)
+            if result is not None:
+                self._images.move_to_end(key)
+                return result
+
+        result = self._build_img(gray_values)
+        self._add_img(key, result)
+        return result
+
+    def prerender(self, albedo_seqs: tp.Iterable[np.ndarray]) -> list[Future]:
+        """
+        Build images for each sequence of albedos on a background thread,
+        so that img_from_albedos can return them without delay.
+        Identical sequences are built only once.  Return futures for the
+        images being built.
+        """
+        result = []
+        for albedos in albedo_seqs:
+            gray_values = self._gray_values(albedos)
+            key = gray_values.tobytes()
+            with self._lock:
+                if key in self._images or key in self._pending:
+                    continue
+                self._pending.add(key)
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1)
+            result.append(
+                self._executor.submit(self._prerender_img, key, gray_values)
+            )
+        return result
+
+    def _gray_values(self, albedos: np.ndarray) -> np.ndarray:
         # Require albedos to be in 0.0 ... 1.0
         # Map those to grayscale values, 0..255.
         # Assume the albedo values are for a set of evenly-spaced latitude
@@ -43,39 +98,67 @@ class AlbedoTextureMapper:
         if np.any(albedos < 0.0) or np.any(albedos > 1.0):  # noqa: PLR2004
             msg = f"Albedo values must be in 0.0 ... 1.0: {albedos}"
             raise ValueError(msg)
-
-        gray_values = (255 * albedos).astype(np.uint8)
-        if len(albedos) <= 1:
-            return self._create_img(gray_values)
-        return self._proportional_img(list(gray_values))
-
-    def _proportional_img(self, gray_values: list[int]) -> QImage:
+        return (255 * albedos).astype(np.uint8)
+
+    def _build_img(self, gray_values: np.ndarray) -> QImage:
+        if len(gray_values) <= 1:
+            return self._create_img(gray_values.reshape(-1, 1))
+        return self._proportional_img(gray_values)
+
+    def _prerender_img(self, key: bytes, gray_values: np.ndarray) -> QImage:
+        try:
+            result = self._build_img(gray_values)
+            self._add_img(key, result)
+            return result
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def _add_img(self, key: bytes, img: QImage) -> None:
+        with self._lock:
+            self._images[key] = img
+            self._images.move_to_end(key)
+            if len(self._images) > self._max_images:
+                self._images.popitem(last=False)
+
+    def _proportional_img(self, gray_values: np.ndarray) -> QImage:
         # Map the per-latitude values to cartesian.  Assume the first value
-        # is for latitude 0, the last for latitude 90°.
-        num_intervals = len(gray_values)
-        values: list[int] = []
-        dlat = math.pi / num_intervals
-        lat = -math.pi / 2.0
-        scale = 100.0
-
-        for v in gray_values:
-            lat_next = lat + dlat
-
-            y0 = int(scale * math.sin(lat))
-            yf = int(scale * math.sin(lat_next))
-            values += [v] * (yf - y0)
-
-            lat = lat_next
-
-        np_values = np.array(values, dtype=np.uint8)
-        np_values.shape = (len(values), 1)
-        return self._create_img(np_values)
+        # is for latitude -90°, the last for latitude 90°.
+        rows = self._rows_for_bands(len(gray_values))
+        result = QImage(1, len(rows), QImage.Format_Grayscale8)
+        # Fill the image's own pixel buffer, with one gather.
+        pixels = np.ndarray(
+            (len(rows),),
+            dtype=np.uint8,
+            buffer=result.bits(),
+            strides=(result.bytesPerLine(),),
+        )
+        pixels[:] = gray_values[rows]
+        return result
+
+    def _rows_for_bands(self, num_bands: int) -> np.ndarray:
+        # Get the band index for each image row.  Each band gets at least
+        # one row; the rest are shared in proportion to each band's extent
+        # along the rotational axis.
+        result = self._band_rows.get(num_bands)
+        if result is None:
+            height = max(self._height, num_bands)
+            lats = np.linspace(-math.pi / 2.0, math.pi / 2.0, num_bands + 1)
+            extents = (np.sin(lats) + 1.0) / 2.0
+            spare_rows = np.rint(extents * (height - num_bands)).astype(int)
+            edges = np.arange(num_bands + 1) + spare_rows
+            result = np.repeat(np.arange(num_bands), np.diff(edges))
+            self._band_rows[num_bands] = result
+        return result
 
     def _create_img(self, values: np.ndarray) -> QImage:
         (h, w) = values.shape
-        return QImage(values.data, w, h, 1, QImage.Format_Grayscale8)
+        # Copy, so the image doesn't refer to values' memory.
+        return QImage(values.data, w, h, w, QImage.Format_Grayscale8).copy()
 
     def _save_img(self, img: QImage) -> Path:
+        if self._working_dir is None:
+            self._working_dir = Path(tempfile.mkdtemp())
         output_name = self._working_dir / next(self._img_ids)
         img.save(str(output_name))
         return output_name
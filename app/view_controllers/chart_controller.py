@@ -5,8 +5,9 @@ Provides user interaction for a rising/falling temperature chart.
 
 import typing as tp
 
+import numpy as np
 from PySide6 import QtCharts
-from PySide6.QtCore import QObject, QPointF, Qt, Signal
+from PySide6.QtCore import QObject, QPointF, Qt, QTimer, Signal
 from PySide6.QtGui import QPen
 from PySide6.QtWidgets import QGraphicsLineItem
 
@@ -14,6 +15,60 @@ from ..layout.mousing_chart import MousingChart
 from ..model.model import AvgTempResult
 
 
+class _Branch:
+    # The results for one branch, in order of increasing solar
+    # multiplier, with at most one result per solar multiplier.
+    def __init__(self) -> None:
+        self.xs = np.empty(0)
+        self.ys = np.empty(0)
+        self.results = np.empty(0, dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def merge(self, new_results: list[AvgTempResult]) -> None:
+        # New results replace old ones with the same solar multiplier;
+        # later new results replace earlier ones.
+        new_xs = np.array([r.solar_mult for r in new_results], dtype=float)
+        new_ys = np.array([r.solution.avg for r in new_results], dtype=float)
+        objs = np.empty(len(new_results), dtype=object)
+        objs[:] = new_results
+
+        xs = np.concatenate((self.xs, new_xs))
+        ys = np.concatenate((self.ys, new_ys))
+        results = np.concatenate((self.results, objs))
+
+        order = np.argsort(xs, kind="stable")
+        xs = xs[order]
+        # Stable sort puts the newest of equal solar multipliers last.
+        keep = np.append(xs[1:] != xs[:-1], True)
+        order = order[keep]
+        self.xs = xs[keep]
+        self.ys = ys[order]
+        self.results = results[order]
+
+    def nearest(self, x: float) -> AvgTempResult | None:
+        if not len(self.xs):
+            return None
+        i = int(np.searchsorted(self.xs, x))
+        if i == len(self.xs) or (
+            i > 0 and x - self.xs[i - 1] <= self.xs[i] - x
+        ):
+            i -= 1
+        return self.results[i]
+
+    def behind(self, x: float, rising: bool) -> AvgTempResult | None:
+        # Get the nearest result at or below x if rising, else at or
+        # above x.
+        if rising:
+            i = int(np.searchsorted(self.xs, x, side="right")) - 1
+        else:
+            i = int(np.searchsorted(self.xs, x, side="left"))
+        if 0 <= i < len(self.xs):
+            return self.results[i]
+        return None
+
+
 class ChartController(QObject):
     """
     Manages user interaction for a rising/falling temperature chart.
@@ -22,6 +77,14 @@ class ChartController(QObject):
     selected_solar_mult = Signal(float)
     chart_hover_pos = Signal(QPointF)
 
+    _UPDATE_MSEC = 50
+    # Hover events are handled at most once per display frame:
+    _FRAME_MSEC = 16
+    # The selected solar multiplier is updated at most this often, when
+    # the pointer has moved by at least this fraction of the x axis range:
+    _SELECT_MSEC = 50
+    _SELECT_FRACTION = 0.005
+
     def __init__(
         self, chart: MousingChart, chart_view: QtCharts.QChartView
     ) -> None:
@@ -29,9 +92,19 @@ class ChartController(QObject):
         self._chart = chart
         self._chart_view = chart_view
 
-        # Handle chart hover events, with debounce.
+        # Handle chart hover events, with debounce.  Bursts of events
+        # are merged, keeping the latest position.  The hover line and
+        # the selected solar multiplier are updated at separate rates.
         self._chart.hovered.connect(self._handle_chart_hover)
-        self._last_chart_x = -100.0
+        self._hover_point: QPointF | None = None
+        self._hover_timer = self._single_shot_timer(
+            self._FRAME_MSEC, self._apply_hover
+        )
+        self._last_chart_x: float | None = None
+        self._selected_x: float | None = None
+        self._select_timer = self._single_shot_timer(
+            self._SELECT_MSEC, self._apply_selection
+        )
 
         self._chart.removeAllSeries()
         self._rising = self._line_series("Rising")
@@ -47,11 +120,23 @@ class ChartController(QObject):
         self._chart.setAcceptHoverEvents(True)
         self._chart.setCursor(Qt.CrossCursor)
 
-        # Track added values.
-        self._x_vals: set[float] = set()
-        self._y_vals: set[float] = set()
-        self._rising_results: list[AvgTempResult] = []
-        self._falling_results: list[AvgTempResult] = []
+        # Track added values.  New results are applied to the chart in
+        # bulk, at most once per _UPDATE_MSEC.
+        self._rising_results = _Branch()
+        self._falling_results = _Branch()
+        self._pending: list[AvgTempResult] = []
+        self._update_timer = self._single_shot_timer(
+            self._UPDATE_MSEC, self._apply_pending
+        )
+
+    def _single_shot_timer(
+        self, msec: int, slot: tp.Callable[[], None]
+    ) -> QTimer:
+        result = QTimer(self)
+        result.setSingleShot(True)
+        result.setInterval(msec)
+        result.timeout.connect(slot)
+        return result
 
     def _line_series(self, name: str) -> QtCharts.QLineSeries:
         result = QtCharts.QLineSeries()
@@ -80,36 +165,68 @@ class ChartController(QObject):
     def clear(self) -> None:
         self._rising.clear()
         self._falling.clear()
-        self._x_vals = set()
-        self._y_vals = set()
-        self._rising_results = []
-        self._falling_results = []
-        self._last_chart_x = -100.0
+        self._rising_results = _Branch()
+        self._falling_results = _Branch()
+        self._pending = []
+        self._update_timer.stop()
+        self._last_chart_x = None
 
     def add_result(self, new_result: AvgTempResult) -> None:
-        x = new_result.solar_mult
-        y = new_result.solution.avg
-
-        is_rising = new_result.delta > 0
-
-        series = self._rising if is_rising else self._falling
-        series.append(x, y)
+        """
+        Merge a result into its branch.  It replaces any result with the
+        same solar multiplier.
+        """
+        self.add_results([new_result])
 
-        results = self._rising_results if is_rising else self._falling_results
-        results.append(new_result)
-        self._x_vals.add(x)
-        self._y_vals.add(y)
+    def add_results(self, new_results: list[AvgTempResult]) -> None:
+        """Merge results into their branches, as add_result does."""
+        self._pending.extend(new_results)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
 
     def finished_adding(self) -> None:
-        if self._x_vals:
-            xmin, xmax = min(self._x_vals), max(self._x_vals)
-            self._chart.axisX().setRange(xmin, xmax)
-
-        if self._y_vals:
-            ymin, ymax = min(self._y_vals), max(self._y_vals)
-            self._chart.axisY().setRange(ymin, ymax)
+        self._apply_pending()
+        branches = [
+            b for b in [self._rising_results, self._falling_results] if len(b)
+        ]
+        if branches:
+            xs = np.concatenate([b.xs for b in branches])
+            self._chart.axisX().setRange(xs.min(), xs.max())
+
+            ys = np.concatenate([b.ys for b in branches])
+            self._chart.axisY().setRange(ys.min(), ys.max())
+
+    def _apply_pending(self) -> None:
+        self._update_timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        for branch, series, results in [
+            (
+                self._rising_results,
+                self._rising,
+                [r for r in pending if r.delta > 0],
+            ),
+            (
+                self._falling_results,
+                self._falling,
+                [r for r in pending if r.delta <= 0],
+            ),
+        ]:
+            if results:
+                branch.merge(results)
+                series.replaceNp(branch.xs, branch.ys)
 
     def _handle_chart_hover(self, point: QPointF) -> None:
+        self._hover_point = point
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+
+    def _apply_hover(self) -> None:
+        point, self._hover_point = self._hover_point, None
+        if point is None:
+            return
+
         # Transform to the data coordinate-space of the chart.
         # See https://stackoverflow.com/a/44078533
         scene_pos = self._chart_view.mapToScene(point.toPoint())
@@ -119,39 +236,51 @@ class ChartController(QObject):
 
         self.chart_hover_pos.emit(scene_pos)
 
-        # TODO smooth to a fraction of the data space extent,
-        # rather than an absolute magnitude.
-        abs_dx = abs(series_x - self._last_chart_x)
-        if abs_dx >= 0.1:
+        min_dx = self._SELECT_FRACTION * self._x_range()
+        if (
+            self._last_chart_x is None
+            or abs(series_x - self._last_chart_x) >= min_dx
+        ):
             self._last_chart_x = series_x
-            self.selected_solar_mult.emit(series_x)
+            self._selected_x = series_x
+            if not self._select_timer.isActive():
+                self._select_timer.start()
+
+    def _apply_selection(self) -> None:
+        x, self._selected_x = self._selected_x, None
+        if x is not None:
+            self.selected_solar_mult.emit(x)
+
+    def _x_range(self) -> float:
+        axes = self._chart.axes(Qt.Horizontal)
+        if not axes:
+            return 0.0
+        return axes[0].max() - axes[0].min()
 
     def get_rising_solution(self, solar_mult: float) -> AvgTempResult | None:
         """
         Get the 'rising solar multiplier' latitude bands for
         a given solar multiplier.
         """
-        if not self._rising_results:
-            return None
-
-        i = self._nearest(solar_mult, self._rising_results)
-        return self._rising_results[i]
+        self._apply_pending()
+        return self._rising_results.nearest(solar_mult)
 
     def get_falling_solution(self, solar_mult: float) -> AvgTempResult | None:
         """
         Get the 'falling solar multiplier' latitude bands for
         a given solar multiplier.
         """
-        if not self._falling_results:
-            return None
-
-        i = self._nearest(solar_mult, self._falling_results)
-        return self._falling_results[i]
+        self._apply_pending()
+        return self._falling_results.nearest(solar_mult)
 
-    def _nearest(
-        self, solar_mult: float, records: list[AvgTempResult]
-    ) -> int:
-        dists = [
-            (abs(r.solar_mult - solar_mult), i) for i, r in enumerate(records)
-        ]
-        return min(dists)[-1]
+    def get_solution_behind(
+        self, solar_mult: float, rising: bool
+    ) -> AvgTempResult | None:
+        """
+        Get the nearest result from which a branch reaches solar_mult:
+        at or below it on the rising branch, at or above it on the
+        falling branch.
+        """
+        self._apply_pending()
+        branch = self._rising_results if rising else self._falling_results
+        return branch.behind(solar_mult, rising)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Solves on demand for solar multipliers between the points of a sweep.
+"""
+
+import typing as tp
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject, Signal
+
+from ..model.model import AvgTempResult, Model, ResultGen
+from .sweep_worker import SweepWorker
+
+
+class HoverSolver(QObject):
+    """
+    Finds results for hovered solar multipliers.  When no sweep result is
+    close enough, the solar multiplier is solved for on a background
+    thread, starting from the nearest sweep result behind it on the same
+    branch.  Solar multipliers are rounded to a grid of num_points steps
+    across the sweep range, so that nearby requests share results.
+    The most recently used max_results results are kept.
+    """
+
+    # Emitted when newly solved results are available.
+    results_ready = Signal(list)
+
+    def __init__(
+        self, model: Model, max_results: int = 256, num_points: int = 200
+    ) -> None:
+        super().__init__()
+        self._model = model
+        self._max_results = max_results
+        self._num_points = num_points
+        # Solves are quick, and requests are already debounced.
+        self._worker = SweepWorker(debounce_msec=0, batch_msec=0)
+        self._worker.results_ready.connect(self._add_results)
+
+        self._sweep: dict[str, tp.Any] | None = None
+        self._step = 0.0
+        # Results keyed by branch (True if rising) and grid index:
+        self._results: OrderedDict[
+            tuple[bool, int], AvgTempResult
+        ] = OrderedDict()
+        # Solves wanted for each branch: grid index and starting result.
+        self._wanted: dict[bool, tuple[int, AvgTempResult]] = {}
+
+    def set_sweep(
+        self,
+        min_solar_mult: float,
+        max_solar_mult: float,
+        initial_gat: float,
+        num_lat_zones: int,
+        lat_transfer_coeff: float = 7.6,
+    ) -> None:
+        """
+        Solve for points of a sweep with these parameters from now on.
+        Results for any other sweep are discarded.
+        """
+        sweep = {
+            "min_solar_mult": min_solar_mult,
+            "max_solar_mult": max_solar_mult,
+            "initial_gat": initial_gat,
+            "num_lat_zones": num_lat_zones,
+            "lat_transfer_coeff": lat_transfer_coeff,
+        }
+        if sweep == self._sweep:
+            return
+        self.clear()
+        self._sweep = sweep
+        self._step = (max_solar_mult - min_solar_mult) / self._num_points
+
+    def clear(self) -> None:
+        """Cancel any solves, and discard all results."""
+        self._worker.cancel()
+        self._sweep = None
+        self._results.clear()
+        self._wanted.clear()
+
+    def shutdown(self) -> None:
+        """Discard all results, and wait for solves to stop."""
+        self.clear()
+        self._worker.shutdown()
+
+    def best(
+        self,
+        solar_mult: float,
+        nearest: AvgTempResult | None,
+        start: AvgTempResult | None,
+    ) -> AvgTempResult | None:
+        """
+        Get the best available result for solar_mult on a branch.
+        nearest is the sweep result closest to solar_mult on the branch,
+        and start is the closest one behind it.  If neither nearest nor
+        a solved result is within half a grid step, return nearest and
+        start solving; results_ready is emitted when done.
+        """
+        if nearest is None or self._sweep is None or self._step <= 0.0:
+            return nearest
+        if abs(nearest.solar_mult - solar_mult) <= self._step / 2.0:
+            return nearest
+
+        rising = nearest.delta > 0
+        index = self._grid_index(solar_mult)
+        key = (rising, index)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            return result
+
+        if start is not None and self._wanted_index(rising) != index:
+            self._wanted[rising] = (index, start)
+            self._solve_wanted()
+        return nearest
+
+    def _wanted_index(self, rising: bool) -> int | None:
+        wanted = self._wanted.get(rising)
+        return None if wanted is None else wanted[0]
+
+    def _grid_index(self, solar_mult: float) -> int:
+        assert self._sweep is not None
+        return round(
+            (solar_mult - self._sweep["min_solar_mult"]) / self._step
+        )
+
+    def _grid_mult(self, index: int) -> float:
+        assert self._sweep is not None
+        return self._sweep["min_solar_mult"] + index * self._step
+
+    def _solve_wanted(self) -> None:
+        # Starting a solve cancels the previous one, so solve for every
+        # wanted point.
+        model = self._model
+        sweep = dict(self._sweep or {})
+        wanted = [
+            (self._grid_mult(index), start)
+            for index, start in self._wanted.values()
+        ]
+
+        def gen_results() -> ResultGen:
+            for solar_mult, start in wanted:
+                yield model.solve_at(start, solar_mult, **sweep)
+
+        self._worker.start(gen_results)
+
+    def _add_results(self, results: list[AvgTempResult]) -> None:
+        for result in results:
+            rising = result.delta > 0
+            index = self._grid_index(result.solar_mult)
+            self._results[(rising, index)] = result
+            self._results.move_to_end((rising, index))
+            if self._wanted_index(rising) == index:
+                del self._wanted[rising]
+        while len(self._results) > self._max_results:
+            self._results.popitem(last=False)
+        self.results_ready.emit(results)
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Provides a way to depict albedo/temperature by latitude band."""
 
+import typing as tp
+
 import numpy as np
 from PySide6.Qt3DExtras import Qt3DExtras
 from PySide6.Qt3DInput import Qt3DInput
@@ -22,13 +24,20 @@ class _Clickable3DWindow(Qt3DExtras.Qt3DWindow):
 class LatBandsVC:
     """LatBandsVC lays out and controls a view of latitude bands."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, albedo_mapper: AlbedoTextureMapper | None = None
+    ) -> None:
+        """
+        Initialize a new instance.
+        albedo_mapper, which may be shared with other instances, builds
+        and caches the textures.
+        """
         # Documentation for Qt3DWindow is surprisingly scarce...
         self.view = _Clickable3DWindow()  # Qt3DExtras.Qt3DWindow()
         self._configure_view()
         self.widget = QWidget.createWindowContainer(self.view)
         self.sphere_mgr = SphereVC(self.view)
-        self.albedo_mapper = AlbedoTextureMapper()
+        self.albedo_mapper = albedo_mapper or AlbedoTextureMapper()
         self._prev_values = np.zeros(1)
 
         self.view.double_clicked.connect(self.sphere_mgr.reset_camera)
@@ -42,13 +51,24 @@ class LatBandsVC:
         albedos is a sequence of albedo values for one hemisphere,
         extending from equator to pole.
         """
+        all_values = self._pole_to_pole(albedos)
+        if not np.array_equal(all_values, self._prev_values):
+            img = self.albedo_mapper.img_from_albedos(all_values)
+            self.sphere_mgr.set_texture_image(img)
+            self._prev_values = all_values
+
+    def prerender(self, albedo_seqs: tp.Iterable[np.ndarray]) -> None:
+        """
+        Build textures for each sequence of albedos in the background,
+        so that later calls to set_albedos for them are fast.
+        """
+        self.albedo_mapper.prerender(
+            self._pole_to_pole(albedos) for albedos in albedo_seqs
+        )
+
+    def _pole_to_pole(self, albedos: np.ndarray) -> np.ndarray:
         # Albedos covers one hemisphere from equator to pole, so it
         # needs to be doubled to represent pole to pole
         eq_to_pole = albedos
         pole_to_eq = albedos[::-1]
-        all_values = np.concatenate((pole_to_eq, eq_to_pole))
-
-        if not np.array_equal(all_values, self._prev_values):
-            path = self.albedo_mapper.img_path_from_albedos(all_values)
-            self.sphere_mgr.set_texture(path)
-            self._prev_values = all_values
+        return np.concatenate((pole_to_eq, eq_to_pole))
@@ -4,14 +4,19 @@ Adds behavior to the main window.
 """
 
 import sys
+from pathlib import Path
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QStandardPaths, SignalInstance
 from PySide6.QtWidgets import QApplication
 
 from ..layout.main_win import MainWin
-from ..model.model import AvgTempResult, Model, ResultGen
+from ..model.model import AvgTempResult, Model
+from ..model.solution_cache import SolutionCache
+from ..model.sweep_cache import SweepCache
 from .chart_controller import ChartController
+from .hover_solver import HoverSolver
 from .number_field import NumberField
+from .sweep_worker import SweepWorker
 
 
 class MainWinController:
@@ -33,16 +38,26 @@ class MainWinController:
         )
         self._lat_trans_field = NumberField.for_float(mw.lhtc_field)
 
-        self._model: Model | None = None
-        self._result_gen: ResultGen | None = None
+        # Keep one model, so that edits can reuse earlier solutions.
+        self._model = Model(SolutionCache())
+        # Finished sweeps are kept on disk, across runs of the app.
+        cache_dir = QStandardPaths.writableLocation(
+            QStandardPaths.CacheLocation
+        )
+        self._sweep_cache = SweepCache(Path(cache_dir) / "sweeps")
+        self._sweep_worker = SweepWorker()
         self._results: list[AvgTempResult] = []
+        # Parameters of the sweep which produced self._results:
+        self._sweep_params: tuple | None = None
+        # Solves for hovered solar multipliers between sweep results:
+        self._hover_solver = HoverSolver(self._model)
+        self._selected_solar_mult: float | None = None
 
         self._chart_controller = ChartController(
             mw.gatsm_chart, mw.gatsm_view
         )
 
-        self._rising_vc = mw.rising_vc
-        self._falling_vc = mw.falling_vc
+        self._main_content = mw
 
         self._connect_controls()
         self._init_control_content()
@@ -50,6 +65,19 @@ class MainWinController:
     def show(self) -> None:
         self._main_win.show()
 
+    @property
+    def sweep_results_ready(self) -> SignalInstance:
+        """
+        Emitted with each batch of sweep results, after the batch has
+        been charted.
+        """
+        return self._sweep_worker.results_ready
+
+    @property
+    def sweep_finished(self) -> SignalInstance:
+        """Emitted when a sweep has finished."""
+        return self._sweep_worker.finished
+
     def _connect_controls(self) -> None:
         self._exit_action.triggered.connect(self._main_win.close)
         for field in [
@@ -63,6 +91,12 @@ class MainWinController:
         self._chart_controller.selected_solar_mult.connect(
             self._select_solar_mult
         )
+        self._hover_solver.results_ready.connect(self._show_selection)
+        self._sweep_worker.results_ready.connect(self._add_results)
+        self._sweep_worker.finished.connect(
+            self._chart_controller.finished_adding
+        )
+        self._sweep_worker.failed.connect(self._sweep_failed)
 
     def _init_control_content(self) -> None:
         # Set default field values.
@@ -73,45 +107,110 @@ class MainWinController:
         self._lat_trans_field.set_value(7.6)
 
     def _model_updated(self) -> None:
-        self._model = Model()
-        self._chart_controller.clear()
-
-        self._result_gen = None
+        self._sweep_worker.cancel()
+        self._main_win.status.clearMessage()
         try:
             sm_min = self._min_sol_mult_field.value()
             sm_max = self._max_sol_mult_field.value()
             gat = self._gat0_field.value()
             lat_bands = int(self._lat_bands_field.value())
             lat_heat_transfer = self._lat_trans_field.value()
-            self._result_gen = self._model.gen_temps(
-                sm_min, sm_max, gat, lat_bands, lat_heat_transfer
-            )
-            self._get_result_later(10)
         except ValueError:
-            pass
-
-    def _get_result_later(self, msec: int | None = None) -> None:
-        if msec is None:
-            msec = 10
-        QTimer.singleShot(msec, self._get_model_result)
-
-    def _get_model_result(self) -> None:
-        if self._result_gen is not None:
-            try:
-                result = self._result_gen.send(None)
-                self._chart_controller.add_result(result)
-                self._get_result_later()
-            except StopIteration:
-                self._chart_controller.finished_adding()
+            self._chart_controller.clear()
+            self._hover_solver.clear()
+            return
+        problem = self._input_problem(sm_min, sm_max, lat_bands)
+        if problem:
+            self._chart_controller.clear()
+            self._hover_solver.clear()
+            self._main_win.status.showMessage(problem)
+            return
+        self._hover_solver.set_sweep(
+            sm_min, sm_max, gat, lat_bands, lat_heat_transfer
+        )
+
+        # If only the solar multiplier range changed, reuse what we can.
+        params = (gat, lat_bands, lat_heat_transfer)
+        previous = self._results if params == self._sweep_params else []
+        self._sweep_params = params
+        self._results = self._model.reusable_results(
+            previous, sm_min, sm_max, lat_bands
+        )
+        self._chart_controller.clear()
+        self._chart_controller.add_results(self._results)
+
+        model = self._model
+        kept = list(self._results)
+        if kept:
+            self._sweep_worker.start(
+                lambda: model.extend_temps(
+                    kept, sm_min, sm_max, gat, lat_bands, lat_heat_transfer
+                )
+            )
+        else:
+            sweep_cache = self._sweep_cache
+            self._sweep_worker.start(
+                lambda: sweep_cache.gen_temps(
+                    model, sm_min, sm_max, gat, lat_bands, lat_heat_transfer
+                )
+            )
+
+    def _add_results(self, results: list[AvgTempResult]) -> None:
+        # The latitude band views aren't needed until there are results
+        # to show.
+        mw = self._main_content
+        mw.create_lat_bands_vcs()
+        # Build textures now, so that hovering over the chart is fast.
+        mw.rising_vc.prerender(
+            r.solution.albedos for r in results if r.delta > 0
+        )
+        mw.falling_vc.prerender(
+            r.solution.albedos for r in results if r.delta <= 0
+        )
+        self._results.extend(results)
+        self._chart_controller.add_results(results)
+
+    @staticmethod
+    def _input_problem(sm_min: float, sm_max: float, lat_bands: int) -> str:
+        # Describe what's wrong with the inputs, if anything.
+        if lat_bands < 1:
+            return "Need at least one latitude band."
+        if sm_min >= sm_max:
+            return "Min solar multiplier must be less than max."
+        return ""
+
+    def _sweep_failed(self, message: str) -> None:
+        # Show what was computed, and why the rest is missing.
+        self._chart_controller.finished_adding()
+        self._main_win.status.showMessage(f"Sweep failed: {message}")
 
     def _select_solar_mult(self, solar_mult: float) -> None:
+        self._selected_solar_mult = solar_mult
+        self._show_selection()
+
+    def _show_selection(self) -> None:
+        # Show the best results available for the selected solar
+        # multiplier.  This runs again as better results are solved for.
+        solar_mult = self._selected_solar_mult
+        if solar_mult is None:
+            return
         cc = self._chart_controller
-        atr_up = cc.get_rising_solution(solar_mult)
-        atr_down = cc.get_falling_solution(solar_mult)
-        if atr_up is not None:
-            self._rising_vc.set_albedos(atr_up.solution.albedos)
-        if atr_down is not None:
-            self._falling_vc.set_albedos(atr_down.solution.albedos)
+        hs = self._hover_solver
+        atr_up = hs.best(
+            solar_mult,
+            cc.get_rising_solution(solar_mult),
+            cc.get_solution_behind(solar_mult, True),
+        )
+        atr_down = hs.best(
+            solar_mult,
+            cc.get_falling_solution(solar_mult),
+            cc.get_solution_behind(solar_mult, False),
+        )
+        mw = self._main_content
+        if atr_up is not None and mw.rising_vc is not None:
+            mw.rising_vc.set_albedos(atr_up.solution.albedos)
+        if atr_down is not None and mw.falling_vc is not None:
+            mw.falling_vc.set_albedos(atr_down.solution.albedos)
 
 
 if __name__ == "__main__":
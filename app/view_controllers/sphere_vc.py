@@ -10,10 +10,27 @@ from PySide6.Qt3DCore import Qt3DCore
 from PySide6.Qt3DExtras import Qt3DExtras
 from PySide6.Qt3DRender import Qt3DRender
 from PySide6.QtCore import QUrl
-from PySide6.QtGui import QColor
+from PySide6.QtGui import QColor, QImage, QPainter
 from PySide6.QtGui import QVector3D as V3
 
 
+class _ImageTexture(Qt3DRender.QPaintedTextureImage):
+    """Supplies texture data from an in-memory image."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._img = QImage()
+
+    def set_image(self, img: QImage) -> None:
+        self._img = img
+        self.setSize(img.size())
+        # Ask Qt3D to repaint the texture data.
+        self.update()
+
+    def paint(self, painter: QPainter) -> None:
+        painter.drawImage(0, 0, self._img)
+
+
 # See https://code.qt.io/cgit/qt/qt3d.git/tree/examples/qt3d/basicshapes-cpp/main.cpp?h=5.13  # noqa: E501
 # I try to separate GUI-related code into layout and interaction, but of
 # course "widgets" - the things being arranged - encompass both.
@@ -62,6 +79,8 @@ class SphereVC:
         self.entity.addComponent(self.transform)
 
         self.loader: Qt3DRender.QTextureLoader | None = None
+        self.texture: Qt3DRender.QTexture2D | None = None
+        self._texture_image: _ImageTexture | None = None
 
         view.setRootEntity(self.root_entity)
         self.entity.setEnabled(True)
@@ -97,3 +116,22 @@ class SphereVC:
 
         if self.material.diffuse() != self.loader:
             self.material.setDiffuse(self.loader)
+
+    def set_texture_image(self, img: QImage) -> None:
+        """Set the texture for self's sphere from an in-memory image.
+
+        Args:
+            img: the texture
+        """
+        if self.texture is None:
+            tex = self.texture = Qt3DRender.QTexture2D(self.entity)
+            # Match QTextureLoader's filtering.
+            tex.setMinificationFilter(Qt3DRender.QAbstractTexture.Linear)
+            tex.setMagnificationFilter(Qt3DRender.QAbstractTexture.Linear)
+            self._texture_image = _ImageTexture()
+            tex.addTextureImage(self._texture_image)
+
+        self._texture_image.set_image(img)
+
+        if self.material.diffuse() != self.texture:
+            self.material.setDiffuse(self.texture)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Runs model sweeps on a background thread.
+"""
+
+import time
+import typing as tp
+
+from PySide6.QtCore import QCoreApplication, QObject, QThread, QTimer, Signal
+
+from ..model.model import AvgTempResult, ResultGen
+from ..model.temp_solver import Error
+
+ResultGenFactory = tp.Callable[[], ResultGen]
+
+
+class _SweepThread(QThread):
+    # Runs one sweep, emitting its results in batches.
+    batch_ready = Signal(int, list)
+    sweep_done = Signal(int)
+    sweep_failed = Signal(int, str)
+
+    def __init__(
+        self, job_id: int, make_gen: ResultGenFactory, batch_secs: float
+    ) -> None:
+        super().__init__()
+        self._job_id = job_id
+        self._make_gen = make_gen
+        self._batch_secs = batch_secs
+
+    def run(self) -> None:
+        batch: list[AvgTempResult] = []
+        t_emit = time.monotonic() + self._batch_secs
+        try:
+            for result in self._make_gen():
+                if self.isInterruptionRequested():
+                    return
+                batch.append(result)
+                if time.monotonic() >= t_emit:
+                    self.batch_ready.emit(self._job_id, batch)
+                    batch = []
+                    t_emit = time.monotonic() + self._batch_secs
+        except Exception as e:
+            # Deliver the results computed before the failure.  Report
+            # any exception, so the sweep doesn't silently stop.
+            if batch:
+                self.batch_ready.emit(self._job_id, batch)
+            message = str(e) if isinstance(e, Error) else repr(e)
+            self.sweep_failed.emit(self._job_id, message)
+            return
+        if batch:
+            self.batch_ready.emit(self._job_id, batch)
+        self.sweep_done.emit(self._job_id)
+
+
+class SweepWorker(QObject):
+    """
+    Runs one sweep at a time on a background thread, delivering results
+    in batches.  Starting a new sweep cancels the current one; the new
+    sweep begins once requests have stopped arriving for debounce_msec.
+    If the sweep raises, e.g. because the model fails to converge,
+    failed is emitted with the error message instead of finished.
+    """
+
+    results_ready = Signal(list)
+    finished = Signal()
+    failed = Signal(str)
+
+    def __init__(
+        self, debounce_msec: int = 150, batch_msec: int = 50
+    ) -> None:
+        super().__init__()
+        self._batch_secs = batch_msec / 1000.0
+        self._job_id = 0
+        self._pending: ResultGenFactory | None = None
+        # Cancelled threads may still be running; keep them until they
+        # finish.
+        self._threads: set[_SweepThread] = set()
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_msec)
+        self._debounce.timeout.connect(self._start_pending)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def start(self, make_gen: ResultGenFactory) -> None:
+        """
+        Cancel the current sweep, and run the generator returned by
+        make_gen instead.  make_gen is called on the background thread.
+        """
+        self.cancel()
+        self._pending = make_gen
+        self._debounce.start()
+
+    def cancel(self) -> None:
+        """Cancel the current sweep.  It delivers no further results."""
+        self._job_id += 1
+        self._pending = None
+        self._debounce.stop()
+        for thread in self._threads:
+            thread.requestInterruption()
+
+    def shutdown(self) -> None:
+        """Cancel the current sweep and wait for all threads to stop."""
+        self.cancel()
+        for thread in list(self._threads):
+            thread.wait()
+
+    def _start_pending(self) -> None:
+        make_gen, self._pending = self._pending, None
+        if make_gen is None:
+            return
+        thread = _SweepThread(self._job_id, make_gen, self._batch_secs)
+        thread.batch_ready.connect(self._on_batch_ready)
+        thread.sweep_done.connect(self._on_sweep_done)
+        thread.sweep_failed.connect(self._on_sweep_failed)
+        thread.finished.connect(lambda: self._forget(thread))
+        self._threads.add(thread)
+        thread.start()
+
+    def _forget(self, thread: _SweepThread) -> None:
+        # finished is emitted just before the thread exits.
+        thread.wait()
+        self._threads.discard(thread)
+
+    def _on_batch_ready(self, job_id: int, batch: list) -> None:
+        if job_id == self._job_id:
+            self.results_ready.emit(batch)
+
+    def _on_sweep_done(self, job_id: int) -> None:
+        if job_id == self._job_id:
+            self.finished.emit()
+
+    def _on_sweep_failed(self, job_id: int, message: str) -> None:
+        if job_id == self._job_id:
+            self.failed.emit(message)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Measure GUI startup: time from process launch to the main window being
+shown, to the first result being charted, and to the last.
+
+Run from the project root directory, e.g.,
+`python -m benchmarks.bench_startup --runs 5`.  Each run is a fresh
+process, so imports are included in the timings.  After the first run,
+results may come from the on-disk sweep cache.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_MARKS = ["window", "first_point", "last_point"]
+
+
+def child() -> None:
+    # Runs in the measured process.  Prints each mark as "name time".
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from app.layout.main_win import MainWin
+    from app.view_controllers.main_win_controller import MainWinController
+
+    def mark(name: str) -> None:
+        print(name, time.time(), flush=True)
+
+    app = QApplication(sys.argv[:1])
+    controller = MainWinController(MainWin())
+    first: list[bool] = []
+
+    def on_results(_results: list) -> None:
+        # The controller has already charted these results.
+        if not first:
+            first.append(True)
+            mark("first_point")
+
+    def on_finished() -> None:
+        mark("last_point")
+        app.quit()
+
+    controller.sweep_results_ready.connect(on_results)
+    controller.sweep_finished.connect(on_finished)
+    controller.show()
+    QTimer.singleShot(0, lambda: mark("window"))
+    # Don't hang if something goes wrong.
+    QTimer.singleShot(60_000, app.quit)
+    app.exec()
+
+
+def run_once(offscreen: bool) -> dict[str, float]:
+    env = dict(os.environ)
+    if offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+    t0 = time.time()
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stdout
+    result = {}
+    for line in output.splitlines():
+        name, _, t = line.partition(" ")
+        if name in _MARKS:
+            result[name] = float(t) - t0
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--offscreen",
+        action="store_true",
+        help="Use Qt's offscreen platform, e.g. when there's no display.",
+    )
+    parser.add_argument(
+        "--child", action="store_true", help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+    if args.child:
+        child()
+        return
+
+    runs = [run_once(args.offscreen) for _ in range(args.runs)]
+    print(f"Median of {args.runs} runs, seconds since launch:")
+    for name in _MARKS:
+        times = [run[name] for run in runs if name in run]
+        if times:
+            print(f"  {name:12s} {statistics.median(times):.3f}")
+        else:
+            print(f"  {name:12s} (not reached)")
+
+
+if __name__ == "__main__":
+    main()
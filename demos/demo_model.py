@@ -7,7 +7,7 @@ the idea of climate tipping points.
 
 import matplotlib.pyplot as plt
 
-from app.model.model import AvgTempResult, Model, ResultSeries
+from app.model.model import Model, ResultSeries, ResultTable
 
 
 def plot_averages(*result_sets: ResultSeries) -> None:
@@ -15,9 +15,7 @@ def plot_averages(*result_sets: ResultSeries) -> None:
     plt.figure()
     for result_set in result_sets:
         results = result_set.results
-        solar_mults = [rec.solar_mult for rec in results]
-        avg_temps = [rec.solution.avg for rec in results]
-        plt.plot(solar_mults, avg_temps, label=result_set.summary)
+        plt.plot(results.solar_mults, results.avgs, label=result_set.summary)
 
     plt.title("Average Temperature vs. Solar Multiplier")
     plt.xlabel("Solar Multiplier")
@@ -28,11 +26,12 @@ def plot_averages(*result_sets: ResultSeries) -> None:
 
 def main() -> None:
     m = Model()
-    rising: list[AvgTempResult] = []
-    falling: list[AvgTempResult] = []
-    for solution in m.gen_temps(4.0, 8.0, -60.0, 9):
-        seq = rising if solution.delta > 0 else falling
-        seq.append(solution)
+    rising = ResultTable(9)
+    falling = ResultTable(9)
+    for block in m.gen_temp_blocks(4.0, 8.0, -60.0, 9):
+        is_rising = block["delta"] > 0
+        rising.append_block(block[is_rising])
+        falling.append_block(block[~is_rising])
 
     plot_averages(
         ResultSeries("Rising", rising), ResultSeries("Falling", falling)
@@ -1,18 +1,31 @@
 #!/usr/bin/env python3
 """
 Provides an interactive 1D EBM.
+Run with arguments, e.g. `one_dim_ebm.py run --help`, for the headless
+command-line interface.
 """
 
 import sys
 
-from PySide6.QtWidgets import QApplication
 
-from app.layout.main_win import MainWin
-from app.view_controllers.main_win_controller import MainWinController
+def main() -> int:
+    if len(sys.argv) > 1:
+        # Don't pay for importing Qt when running headless.
+        from app import cli
+
+        return cli.main(sys.argv[1:])
+
+    from PySide6.QtWidgets import QApplication
+
+    from app.layout.main_win import MainWin
+    from app.view_controllers.main_win_controller import MainWinController
 
-if __name__ == "__main__":
     app = QApplication(sys.argv)
     layout = MainWin()
     controller = MainWinController(layout)
     controller.show()
-    app.exec()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
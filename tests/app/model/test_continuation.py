@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from app.model.continuation import Continuation
+from app.model.earth_model import EarthModel
+from app.model.temp_solver import TempSolver
+
+
+def get_jumps(
+    solver: TempSolver, smults: np.ndarray, temps: np.ndarray
+) -> tuple[float, np.ndarray]:
+    # Return the solar multiplier with the biggest change in global
+    # average temp, and the final temperatures.
+    gats: list[float] = []
+    for sm in smults:
+        solution = solver.solve_newton(sm, temps)
+        gats.append(solution.avg)
+        temps = solution.temps
+    i = np.argmax(np.abs(np.diff(gats)))
+    return (smults[i + 1], temps)
+
+
+def test_trace() -> None:
+    num_lat_zones = 9
+    albedo_width = 1.0
+    sm_min = 4.0
+    sm_max = 9.0
+    step = 0.01
+
+    cont = Continuation(num_lat_zones, albedo_width=albedo_width)
+    diagram = cont.trace(sm_min, sm_max, -60.0)
+    assert diagram.solar_mults[0] == sm_min
+    assert diagram.solar_mults[-1] > sm_max
+    assert diagram.temps.shape == (len(diagram.avgs), num_lat_zones)
+
+    # The outermost folds are the tipping points of the rising and
+    # falling sweeps.  (Near a fold the sweep's solver converges slowly,
+    # so it can overshoot by a step.)
+    solver = TempSolver(EarthModel(num_lat_zones), albedo_width=albedo_width)
+    temps = np.full(num_lat_zones, -60.0)
+    rising, temps = get_jumps(solver, np.arange(sm_min, sm_max, step), temps)
+    falling, _ = get_jumps(solver, np.arange(sm_max, sm_min, -step), temps)
+    fold_mults = [f.solar_mult for f in diagram.folds]
+    assert max(fold_mults) == pytest.approx(rising, abs=2 * step)
+    assert min(fold_mults) == pytest.approx(falling, abs=2 * step)
+
+    # The cold branch is stable up to the first fold, and the branch
+    # just past it is not.
+    i_fold = diagram.folds[0].index
+    assert np.all(diagram.stable[: i_fold + 1])
+    assert not diagram.stable[i_fold + 1]
+    assert diagram.stable[-1]
+
+
+def test_requires_smooth_albedo() -> None:
+    with pytest.raises(ValueError):
+        Continuation(9, albedo_width=0.0)
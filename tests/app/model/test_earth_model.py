@@ -1,6 +1,6 @@
 import pytest
 
-from app.model.earth_model import EarthModel
+from app.model.earth_model import EarthModel, cached_earth_model
 
 
 def test_ctor() -> None:
@@ -31,3 +31,17 @@ def test_lats_height(num_bands: int) -> None:
 def test_effective_solar_constant(num_bands) -> None:
     eg = EarthModel(num_bands)
     assert float(eg.insol_by_lat.sum()) == pytest.approx(1370.0 / 4)
+
+
+def test_cached_earth_model() -> None:
+    cached_earth_model.cache_clear()
+    eg = cached_earth_model(9)
+    assert cached_earth_model(9) is eg
+    assert cached_earth_model(18) is not eg
+    info = cached_earth_model.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+    # Shared instances are read-only.
+    with pytest.raises(ValueError):
+        eg.lats_frac[0] = 0.0
+    assert eg.insol_by_lat.sum() == pytest.approx(1370.0 / 4)
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.model.earth_model import EarthModel
+from app.model.grid import TiledGrid
+from app.model.temp_solver import Error, TempSolver
+
+
+def sweep_avgs(
+    solver: TempSolver, smults: np.ndarray, temps: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    gats: list[float] = []
+    for sm in smults:
+        solution = solver.solve(sm, temps)
+        gats.append(solution.avg)
+        temps = solution.temps
+    return (np.array(gats), temps)
+
+
+def test_compute(tmp_path: Path) -> None:
+    num_lat_zones = 9
+    initial_gat = -60.0
+    smults = np.linspace(4.0, 8.0, 11)
+    coeffs = np.array([3.0, 5.0, 7.6, 9.0, 10.0])
+
+    grid = TiledGrid(
+        tmp_path, smults, coeffs, num_lat_zones, initial_gat, (4, 2)
+    )
+    assert grid.num_tiles == (3, 3)
+    assert grid.compute() == 18
+    assert grid.compute() == 0
+
+    em = EarthModel(num_lat_zones)
+    for j, coeff in enumerate(coeffs):
+        solver = TempSolver(em, coeff)
+        temps = np.full(num_lat_zones, initial_gat)
+        rising, temps = sweep_avgs(solver, smults, temps)
+        falling, _ = sweep_avgs(solver, smults[::-1], temps)
+        assert grid.avgs("rising")[:, j] == pytest.approx(rising, abs=0.1)
+        assert grid.avgs("falling")[::-1, j] == pytest.approx(
+            falling, abs=0.1
+        )
+    assert grid.temps("falling").shape == (11, 5, num_lat_zones)
+
+
+def test_resume(tmp_path: Path) -> None:
+    smults = np.linspace(4.0, 8.0, 11)
+    coeffs = np.array([3.0, 5.0, 7.6, 9.0, 10.0])
+
+    expected_dir = tmp_path / "expected"
+    expected = TiledGrid(expected_dir, smults, coeffs, 9, -60.0, (4, 2))
+    expected.compute()
+
+    partial_dir = tmp_path / "partial"
+    partial = TiledGrid(partial_dir, smults, coeffs, 9, -60.0, (4, 2))
+    assert partial.compute(max_tiles=5) == 5
+    assert partial.done("rising").sum() == 5
+
+    # Pick up where the first run left off.
+    resumed = TiledGrid(partial_dir, smults, coeffs, 9, -60.0, (4, 2))
+    assert resumed.compute() == 13
+    for branch in ["rising", "falling"]:
+        assert np.array_equal(resumed.avgs(branch), expected.avgs(branch))
+
+    with pytest.raises(ValueError):
+        TiledGrid(partial_dir, smults, coeffs, 18, -60.0, (4, 2))
+
+
+def test_unconverged_cells(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Iteration converges too slowly for some of these cells.
+    smults = np.linspace(0.1, 40.0, 300)
+    coeffs = np.linspace(10.0, 50.0, 25)
+    grid = TiledGrid(tmp_path / "grid", smults, coeffs, 9, -60.0)
+    assert grid.compute() == 4
+    for branch in ["rising", "falling"]:
+        assert np.all(grid.done(branch))
+        assert np.all(np.isfinite(grid.avgs(branch)))
+
+    # Cells which can't be solved at all hold NaN, and don't stop the
+    # rest of the grid.
+    def fail(*args: object) -> None:
+        raise Error("Failed to find a self-consistent ice edge.")
+
+    monkeypatch.setattr(TempSolver, "solve_direct", fail)
+    grid = TiledGrid(tmp_path / "failing", smults, coeffs, 9, -60.0)
+    assert grid.compute() == 4
+    avgs = np.asarray(grid.avgs("rising"))
+    failed = np.isnan(avgs)
+    assert np.any(failed)
+    assert not np.any(failed[:, :20])
+    assert np.array_equal(
+        np.isnan(np.asarray(grid.temps("rising"))).any(axis=2), failed
+    )
+    assert grid.compute() == 0
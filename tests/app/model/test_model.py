@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 from app.model.model import Model
 
 
@@ -12,3 +15,133 @@ def test_gen_temps() -> None:
     assert len(results) > 0
     for r in results:
         assert sm_min <= r.solar_mult <= sm_max
+
+
+def test_gen_temps_adaptive() -> None:
+    sm_min = 4.0
+    sm_max = 8.0
+    num_solar_mults = 10
+    coarse_step = (sm_max - sm_min) / num_solar_mults
+    min_step = coarse_step / 16
+
+    m = Model()
+    coarse = list(m.gen_temps(sm_min, sm_max, -60.0, 9))
+    results = list(
+        m.gen_temps(
+            sm_min, sm_max, -60.0, 9, jump_tol=15.0, min_step=min_step
+        )
+    )
+    assert len(results) > len(coarse)
+
+    rising = [r for r in results if r.delta > 0]
+    falling = [r for r in results if r.delta < 0]
+    for seq, sign in [(rising, 1), (falling, -1)]:
+        mults = [r.solar_mult for r in seq]
+        assert mults == sorted(mults, reverse=sign < 0)
+        for r in seq:
+            assert sm_min <= r.solar_mult <= sm_max
+            assert 0.999 * min_step <= abs(r.delta) <= 1.001 * coarse_step
+
+    # The biggest jump on each branch has been narrowed down to
+    # (about) min_step.
+    for seq in [rising, falling]:
+        jumps = [
+            (abs(r1.solution.avg - r0.solution.avg), r1.delta)
+            for r0, r1 in zip(seq, seq[1:])
+        ]
+        _, delta = max(jumps)
+        assert abs(delta) < 2.001 * min_step
+
+
+def test_extend_temps() -> None:
+    m = Model()
+    previous = list(m.gen_temps(4.0, 8.0, -60.0, 9))
+    fresh_count = len(previous)
+
+    # Widen the range: the whole rising branch is reused, and extended
+    # with the same step.
+    kept = m.reusable_results(previous, 4.0, 9.2, 9)
+    assert kept == [r for r in previous if r.delta > 0]
+    new = list(m.extend_temps(previous, 4.0, 9.2, -60.0, 9))
+    assert all(r.solar_mult > kept[-1].solar_mult for r in new if r.delta > 0)
+    assert len([r for r in new if r.delta > 0]) == 3
+
+    expected = list(m.gen_temps(4.0, 9.2, -60.0, 9, num_solar_mults=13))
+    actual = kept + new
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert abs(a.delta - e.delta) < 1.0e-9
+        assert abs(a.solar_mult - e.solar_mult) < 1.0e-9
+        assert np.allclose(a.solution.temps, e.solution.temps)
+
+    # Narrow the range a little.
+    kept = m.reusable_results(previous, 4.0, 7.6, 9)
+    assert [r.solar_mult for r in kept] == [
+        r.solar_mult for r in previous[:9]
+    ]
+
+    # Narrowing the range much, or widening it a lot, means starting
+    # over, at full resolution.
+    for max_solar_mult in [4.8, 6.0, 40.0]:
+        assert m.reusable_results(previous, 4.0, max_solar_mult, 9) == []
+        new = list(m.extend_temps(previous, 4.0, max_solar_mult, -60.0, 9))
+        assert len(new) == fresh_count
+        expected = list(m.gen_temps(4.0, max_solar_mult, -60.0, 9))
+        assert [r.solar_mult for r in new] == [r.solar_mult for r in expected]
+
+    # A new minimum means starting over.
+    assert m.reusable_results(previous, 3.0, 8.0, 9) == []
+    assert m.reusable_results(previous, 4.0, 8.0, 18) == []
+
+
+def test_gen_temp_blocks() -> None:
+    m = Model()
+    expected = list(m.gen_temps(4.0, 8.0, -60.0, 9))
+
+    gen = m.gen_temp_blocks(4.0, 8.0, -60.0, 9, block_size=3)
+    blocks = [next(gen)]
+    # Ask for bigger blocks from here on.
+    blocks.append(gen.send(8))
+    blocks.extend(gen)
+    assert [len(b) for b in blocks] == [3, 8, 8, 1]
+
+    results = np.concatenate(blocks)
+    assert len(results) == len(expected)
+    for row, e in zip(results, expected):
+        assert row["delta"] == e.delta
+        assert row["solar_mult"] == e.solar_mult
+        assert row["avg"] == e.solution.avg
+        assert np.array_equal(row["temps"], e.solution.temps)
+        assert np.array_equal(row["albedos"], e.solution.albedos)
+
+
+def test_solve_at() -> None:
+    m = Model()
+    results = list(m.gen_temps(4.0, 8.0, -60.0, 9))
+    rising = [r for r in results if r.delta > 0]
+    falling = [r for r in results if r.delta <= 0]
+
+    # Solving between sweep points follows the branch, so it agrees
+    # with a finer sweep.
+    fine = list(m.gen_temps(4.0, 8.0, -60.0, 9, num_solar_mults=20))
+    for coarse, start in [(rising, rising[2]), (falling, falling[2])]:
+        mult = start.solar_mult + coarse[0].delta / 2.0
+        result = m.solve_at(start, mult, 4.0, 8.0, -60.0, 9)
+        assert result.solar_mult == mult
+        assert (result.delta > 0) == (start.delta > 0)
+        expected = [
+            r
+            for r in fine
+            if (r.delta > 0) == (start.delta > 0)
+            and abs(r.solar_mult - mult) < 1.0e-9
+        ][0]
+        assert np.allclose(
+            result.solution.temps, expected.solution.temps, atol=0.1
+        )
+
+    start = rising[2]
+    assert m.solve_at(start, start.solar_mult, 4.0, 8.0, -60.0, 9) is start
+    with pytest.raises(ValueError):
+        m.solve_at(rising[2], rising[1].solar_mult, 4.0, 8.0, -60.0, 9)
+    with pytest.raises(ValueError):
+        m.solve_at(falling[2], falling[1].solar_mult, 4.0, 8.0, -60.0, 9)
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.model.model import Model, ResultTable
+from app.model.result_store import ResultStore
+
+
+def test_result_store(tmp_path: Path) -> None:
+    params = {"min_solar_mult": 4.0, "max_solar_mult": 8.0}
+    store = ResultStore.create(tmp_path / "sweep", 9, params)
+    assert len(store) == 0
+    assert len(store.load()) == 0
+
+    # Append results as they stream in.
+    expected = ResultTable(9)
+    for block in Model().gen_temp_blocks(4.0, 8.0, -60.0, 9, block_size=6):
+        table = ResultTable(9)
+        table.append_block(block)
+        store.append(table)
+        expected.append_block(block)
+
+    store = ResultStore(tmp_path / "sweep")
+    assert store.params == params
+    assert store.num_lat_zones == 9
+    assert len(store) == len(expected)
+
+    loaded = store.load()
+    assert isinstance(loaded.temps, np.memmap)
+    for name in ["deltas", "solar_mults", "avgs", "temps", "albedos"]:
+        assert np.array_equal(getattr(loaded, name), getattr(expected, name))
+    assert loaded[3].solution.avg == expected[3].solution.avg
+
+    with pytest.raises(ValueError):
+        store.append(ResultTable(18))
+
+
+def test_result_store_partial_append(tmp_path: Path) -> None:
+    store = ResultStore.create(tmp_path / "sweep", 9)
+    table = ResultTable.from_results(9, Model().gen_temps(4.0, 8.0, -60.0, 9))
+    store.append(table)
+
+    # Simulate an append interrupted partway through.
+    with (tmp_path / "sweep" / "avgs.bin").open("ab") as outf:
+        outf.write(b"\0" * 12)
+    assert len(store) == len(table)
+
+    store.append(table)
+    assert len(store) == 2 * len(table)
+    num_rows = len(table)
+    assert np.array_equal(store.load().avgs[num_rows:], table.avgs)
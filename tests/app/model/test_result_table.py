@@ -0,0 +1,68 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from app.model.model import AvgTempResult, Model, ResultTable, result_dtype
+from app.model.temp_solver import Solution
+
+
+def test_result_table() -> None:
+    m = Model()
+    expected = list(m.gen_temps(4.0, 8.0, -60.0, 9))
+
+    table = ResultTable(9, capacity=4)
+    table.extend(expected[:5])
+    for block in m.gen_temp_blocks(4.0, 8.0, -60.0, 9, block_size=4):
+        table.append_block(block)
+    assert len(table) == 5 + len(expected)
+
+    actual = list(table)[5:]
+    for a, e in zip(actual, expected):
+        assert a.delta == e.delta
+        assert a.solar_mult == e.solar_mult
+        assert a.solution.avg == e.solution.avg
+        assert np.array_equal(a.solution.temps, e.solution.temps)
+        # Step albedos survive exactly.
+        assert np.array_equal(a.solution.albedos, e.solution.albedos)
+
+    assert table[-1].solar_mult == expected[-1].solar_mult
+    assert np.array_equal(table.avgs[5:], [e.solution.avg for e in expected])
+    with pytest.raises(IndexError):
+        table[len(table)]
+
+
+def test_result_table_smooth_albedos() -> None:
+    albedos = np.linspace(0.3, 0.6, 18)
+    result = AvgTempResult(0.1, 1.0, Solution(np.zeros(18), albedos, 0.0))
+    table = ResultTable.from_results(18, [result])
+    assert np.allclose(table[0].solution.albedos, albedos, atol=0.3 / 510)
+
+
+def test_result_table_size() -> None:
+    num_results = 1_000_000
+    table = ResultTable(9)
+    block = np.zeros(num_results, dtype=result_dtype(9))
+    table.append_block(block)
+    assert len(table) == num_results
+    # Three float64 columns, float64 temps and uint8 albedos per band:
+    assert table.nbytes == num_results * (3 * 8 + 9 * 8 + 9)
+
+
+def test_result_table_pickle() -> None:
+    results = list(Model().gen_temps(4.0, 8.0, -60.0, 9, num_solar_mults=20))
+    table = ResultTable(9)
+    table.extend(results)
+    assert table.nbytes == len(results) * (3 * 8 + 9 * 8 + 9)
+
+    # Only the stored results are pickled, not spare capacity.
+    data = pickle.dumps(table)
+    assert len(data) < table.nbytes + 1024
+    assert len(data) < len(pickle.dumps(results))
+
+    copy = pickle.loads(data)
+    assert len(copy) == len(table)
+    assert np.array_equal(copy.temps, table.temps)
+    assert np.array_equal(copy.ice_levels, table.ice_levels)
+    copy.append(results[0])
+    assert len(copy) == len(table) + 1
@@ -0,0 +1,76 @@
+import numpy as np
+
+from app.model.model import Model
+from app.model.solution_cache import BranchKey, SolutionCache
+from app.model.temp_solver import Solution
+
+
+def _solution(num_zones: int, avg: float) -> Solution:
+    temps = np.full(num_zones, avg)
+    return Solution(temps, np.zeros(num_zones), avg)
+
+
+def test_repeat_sweep_hits() -> None:
+    cache = SolutionCache()
+    model = Model(cache)
+    first = list(model.gen_temps(4.0, 8.0, -60.0, 9))
+    assert cache.hits == 0
+
+    second = list(model.gen_temps(4.0, 8.0, -60.0, 9))
+    assert cache.hits == len(second)
+    for actual, expected in zip(second, first):
+        assert actual.solar_mult == expected.solar_mult
+        assert np.array_equal(actual.solution.temps, expected.solution.temps)
+
+
+def test_overlapping_sweep() -> None:
+    cache = SolutionCache()
+    model = Model(cache)
+    list(model.gen_temps(4.0, 8.0, -60.0, 9, num_solar_mults=40))
+    actual = list(model.gen_temps(4.0, 9.0, -60.0, 9, num_solar_mults=20))
+    expected = list(Model().gen_temps(4.0, 9.0, -60.0, 9, num_solar_mults=20))
+
+    # The rising branch starts in the same place, so it is reused.
+    assert cache.hits > 0
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a.solar_mult == e.solar_mult
+        # Warm starts differ, so results agree to within the solver's
+        # convergence threshold.
+        assert abs(a.solution.avg - e.solution.avg) < 0.1
+
+
+def test_nearest_behind() -> None:
+    cache = SolutionCache()
+    rising = BranchKey(9, 7.6, True, -60.0, 4.0, None)
+    falling = BranchKey(9, 7.6, False, -60.0, 4.0, 8.0)
+    for mult in [5.0, 6.0, 7.0]:
+        cache.put(rising, mult, _solution(9, mult))
+        cache.put(falling, mult, _solution(9, -mult))
+
+    assert cache.nearest_behind(rising, 6.5)[0] == 6.0
+    assert cache.nearest_behind(rising, 4.5) is None
+    assert cache.nearest_behind(falling, 6.5)[0] == 7.0
+    assert cache.nearest_behind(falling, 7.5) is None
+    assert cache.get(rising, 6.0).avg == 6.0
+    assert cache.get(falling, 6.0).avg == -6.0
+    assert cache.get(rising, 6.5) is None
+
+
+def test_eviction() -> None:
+    size = _solution(9, 0.0).temps.nbytes * 2 + 256
+    cache = SolutionCache(max_bytes=3 * size)
+    branch = BranchKey(9, 7.6, True, -60.0, 4.0, None)
+    for mult in [4.0, 5.0, 6.0, 7.0]:
+        cache.put(branch, mult, _solution(9, mult))
+        assert cache.num_bytes <= 3 * size
+
+    assert len(cache) == 3
+    assert cache.get(branch, 4.0) is None
+    assert cache.nearest_behind(branch, 4.5) is None
+
+    # Using an entry keeps it from being evicted.
+    assert cache.get(branch, 5.0) is not None
+    cache.put(branch, 8.0, _solution(9, 8.0))
+    assert cache.get(branch, 5.0) is not None
+    assert cache.get(branch, 6.0) is None
@@ -0,0 +1,40 @@
+import itertools
+
+import numpy as np
+
+from app.model.model import Model
+from app.model.sweep import SweepCase, SweepRunner
+
+
+def test_run() -> None:
+    sm_min = 4.0
+    sm_max = 8.0
+    cases = [
+        SweepCase(num_lat_zones, lat_transfer_coeff, initial_gat)
+        for num_lat_zones, lat_transfer_coeff, initial_gat in (
+            itertools.product([9, 18], [3.0, 7.6], [-60.0, 20.0])
+        )
+    ]
+
+    runner = SweepRunner(sm_min, sm_max, max_workers=2, chunksize=3)
+    sweeps = runner.run(cases)
+    assert [s.case for s in sweeps] == cases
+
+    for sweep in sweeps:
+        case = sweep.case
+        expected = list(
+            Model().gen_temps(
+                sm_min,
+                sm_max,
+                case.initial_gat,
+                case.num_lat_zones,
+                case.lat_transfer_coeff,
+            )
+        )
+        assert len(sweep.results) == len(expected)
+        for actual, exp in zip(sweep.results, expected):
+            assert actual.solar_mult == exp.solar_mult
+            assert np.array_equal(actual.solution.temps, exp.solution.temps)
+            assert np.array_equal(
+                actual.solution.albedos, exp.solution.albedos
+            )
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import numpy as np
+
+from app.model.model import Model
+from app.model.sweep_cache import SweepCache
+
+
+def test_sweep_cache(tmp_path: Path) -> None:
+    cache = SweepCache(tmp_path)
+    args = (4.0, 8.0, -60.0, 9)
+    expected = list(cache.gen_temps(Model(), *args))
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # A second cache on the same directory, e.g. in another process.
+    actual = list(SweepCache(tmp_path).gen_temps(Model(), *args))
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert a.solar_mult == e.solar_mult
+        assert np.array_equal(a.solution.temps, e.solution.temps)
+        assert np.array_equal(a.solution.albedos, e.solution.albedos)
+
+    # Different parameters get a different entry.
+    list(cache.gen_temps(Model(), 4.0, 8.0, -60.0, 9, 8.0))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_sweep_cache_eviction(tmp_path: Path) -> None:
+    entry_dir = tmp_path / "measure"
+    list(SweepCache(entry_dir).gen_temps(Model(), 4.0, 8.0, -60.0, 9))
+    (entry,) = entry_dir.iterdir()
+    entry_size = sum(p.stat().st_size for p in entry.iterdir())
+
+    cache = SweepCache(tmp_path / "cache", max_bytes=2 * entry_size)
+    coeffs = [1.0, 2.0, 3.0]
+    for coeff in coeffs:
+        list(cache.gen_temps(Model(), 4.0, 8.0, -60.0, 9, coeff))
+        # Using the first entry keeps it from being evicted.
+        list(cache.gen_temps(Model(), 4.0, 8.0, -60.0, 9, coeffs[0]))
+
+    def params(coeff: float) -> dict:
+        return {
+            "min_solar_mult": 4.0,
+            "max_solar_mult": 8.0,
+            "initial_gat": -60.0,
+            "num_lat_zones": 9,
+            "lat_transfer_coeff": coeff,
+            "num_solar_mults": 10,
+        }
+
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+    assert cache.get(params(1.0)) is not None
+    assert cache.get(params(2.0)) is None
+    assert cache.get(params(3.0)) is not None
+
+
+def test_sweep_cache_key(tmp_path: Path) -> None:
+    cache = SweepCache(tmp_path)
+    key = cache.key({"min_solar_mult": 4.0, "num_lat_zones": 9})
+    assert cache.key({"min_solar_mult": 4, "num_lat_zones": 9}) == key
+    assert (
+        cache.key({"min_solar_mult": np.float64(4.0), "num_lat_zones": 9.0})
+        == key
+    )
+
+    # Integer arguments find the entry cached for float arguments, and
+    # give the same results.
+    expected = list(cache.gen_temps(Model(), 4.0, 8.0, -60.0, 9))
+    actual = list(Model().gen_temps(4, 8, -60, 9))
+    assert len(list(tmp_path.iterdir())) == 1
+    list(cache.gen_temps(Model(), 4, 8, -60, 9))
+    assert len(list(tmp_path.iterdir())) == 1
+    for a, e in zip(actual, expected):
+        assert np.array_equal(a.solution.temps, e.solution.temps)
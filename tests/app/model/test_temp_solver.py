@@ -1,8 +1,10 @@
+import typing as tp
+
 import numpy as np
 import pytest
 
 from app.model.earth_model import EarthModel
-from app.model.temp_solver import Error, TempSolver
+from app.model.temp_solver import Error, Linearization, TempSolver
 
 
 def get_t_avg(
@@ -58,3 +60,230 @@ def test_divergent() -> None:
     temps = np.full(num_lat_zones, 200.0)
     with pytest.raises(Error):
         solver.solve(0.0, temps, max_iter=5)
+
+
+def test_solve_batch() -> None:
+    num_lat_zones = 9
+    eg = EarthModel(num_lat_zones)
+    solver = TempSolver(eg)
+
+    smults = np.array([0.5, 4.0, 6.0, 8.0, 12.0])
+    coeffs = np.array([7.6, 7.6, 3.0, 10.0, 7.6])
+    temps = np.full((len(smults), num_lat_zones), -60.0)
+    temps[-1] = 20.0
+
+    batch = solver.solve_batch(smults, temps, coeffs)
+    assert len(batch) == len(smults)
+    for i, (sm, coeff) in enumerate(zip(smults, coeffs)):
+        expected = TempSolver(eg, coeff).solve(sm, temps[i])
+        actual = batch[i]
+        assert actual.temps == pytest.approx(expected.temps)
+        assert actual.albedos == pytest.approx(expected.albedos)
+        assert actual.avg == pytest.approx(expected.avg)
+    assert np.all(batch.converged)
+
+
+def test_solve_batch_divergent() -> None:
+    num_lat_zones = 360
+    eg = EarthModel(num_lat_zones)
+    solver = TempSolver(eg)
+
+    temps = np.full((3, num_lat_zones), 200.0)
+    with pytest.raises(Error):
+        solver.solve_batch(0.0, temps, max_iter=5)
+
+    # Optionally, report which cases failed instead.  Here a case which
+    # starts at equilibrium converges.
+    temps[1] = solver.equilibria(0.0)[0].temps
+    batch = solver.solve_batch(0.0, temps, max_iter=5, raise_on_failure=False)
+    assert batch.converged.tolist() == [False, True, False]
+    assert np.all(np.isfinite(batch.temps))
+
+
+def test_solve_direct() -> None:
+    num_lat_zones = 9
+    eg = EarthModel(num_lat_zones)
+    solver = TempSolver(eg)
+
+    temps = np.full(num_lat_zones, -60.0)
+    for sm in np.arange(0.4, 10.0, 0.5):
+        expected = solver.solve(sm, temps)
+        actual = solver.solve_direct(sm, temps)
+        assert np.array_equal(actual.albedos, expected.albedos)
+        # The iterative solver stops within its convergence threshold.
+        assert actual.avg == pytest.approx(expected.avg, abs=0.5)
+        temps = actual.temps
+
+
+def test_equilibria() -> None:
+    num_lat_zones = 9
+    eg = EarthModel(num_lat_zones)
+    solver = TempSolver(eg)
+
+    # Within the hysteresis loop there are cold, warm and unstable
+    # equilibria.
+    solutions = solver.equilibria(6.0)
+    assert len(solutions) >= 3
+    avgs = [s.avg for s in solutions]
+    assert avgs == sorted(avgs)
+
+    for s in solutions:
+        # Each equilibrium is a fixed point of the iterative solver.
+        again = solver.solve(6.0, s.temps)
+        assert again.temps == pytest.approx(s.temps)
+        assert np.array_equal(again.albedos, s.albedos)
+
+
+def test_direct_high_resolution() -> None:
+    num_lat_zones = 360
+    eg = EarthModel(num_lat_zones)
+    solver = TempSolver(eg)
+
+    temps = np.full(num_lat_zones, 200.0)
+    solution = solver.solve_direct(0.0, temps)
+    assert [solution.avg] == [s.avg for s in solver.equilibria(0.0)]
+
+
+@pytest.mark.parametrize("accel", ["aitken", "anderson"])
+def test_accelerated(accel: str) -> None:
+    num_lat_zones = 9
+    eg = EarthModel(num_lat_zones)
+    solver = TempSolver(eg)
+
+    temps = np.full(num_lat_zones, -60.0)
+    for sm in np.arange(4.0, 8.0, 0.25):
+        expected = solver.solve(sm, temps)
+        actual = solver.solve(sm, temps, accel=accel, damping=0.8)
+        assert np.array_equal(actual.albedos, expected.albedos)
+        assert actual.avg == pytest.approx(expected.avg, abs=0.5)
+        temps = expected.temps
+
+
+@pytest.mark.parametrize("accel", ["aitken", "anderson"])
+def test_accelerated_high_resolution(accel: str) -> None:
+    num_lat_zones = 360
+    eg = EarthModel(num_lat_zones)
+    solver = TempSolver(eg)
+
+    temps = np.full(num_lat_zones, 200.0)
+    with pytest.raises(Error):
+        solver.solve(0.0, temps, max_iter=10)
+    solution = solver.solve(0.0, temps, max_iter=10, accel=accel)
+    assert solution.avg == pytest.approx(solver.equilibria(0.0)[0].avg, 0.1)
+
+
+@pytest.mark.parametrize("accel", ["aitken", "anderson"])
+@pytest.mark.parametrize("damping", [1.0, 0.7])
+def test_accelerated_near_fold(
+    accel: str, damping: float, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    solver = TempSolver(EarthModel(9))
+    num_updates = 0
+    update = TempSolver._update
+
+    def counting_update(self: TempSolver, *args: np.ndarray) -> tuple:
+        nonlocal num_updates
+        num_updates += 1
+        return update(self, *args)
+
+    monkeypatch.setattr(TempSolver, "_update", counting_update)
+
+    def solve(sm: float, temps: np.ndarray, **kwargs: tp.Any) -> tuple:
+        nonlocal num_updates
+        num_updates = 0
+        return (solver.solve(sm, temps, **kwargs), num_updates)
+
+    # Warm-start from the rising branch, just below the tipping point.
+    temps = np.full(9, -60.0)
+    for sm in np.arange(4.0, 7.4, 0.2):
+        temps = solver.solve(sm, temps).temps
+    for sm in np.arange(7.46, 7.505, 0.01):
+        expected, plain_count = solve(sm, temps, damping=damping)
+        actual, count = solve(sm, temps, accel=accel, damping=damping)
+        # Acceleration settles on the same equilibrium, and costs at most
+        # a few iterations more than plain, equally damped, iteration.
+        assert np.array_equal(actual.albedos, expected.albedos)
+        assert actual.avg == pytest.approx(expected.avg, abs=0.5)
+        assert count <= plain_count + 3
+
+    # A fine sweep across the tipping points always converges, in fewer
+    # iterations overall.
+    mults = np.concatenate(
+        (np.arange(4.0, 8.0, 0.02), np.arange(8.0, 4.0, -0.02))
+    )
+    totals = []
+    for kwargs in [
+        {"damping": damping},
+        {"accel": accel, "damping": damping},
+    ]:
+        total = 0
+        temps = np.full(9, -60.0)
+        for sm in mults:
+            solution, count = solve(sm, temps, **kwargs)
+            temps = solution.temps
+            total += count
+        totals.append(total)
+    assert totals[1] < totals[0]
+
+
+def test_invalid_damping() -> None:
+    solver = TempSolver(EarthModel(9))
+    with pytest.raises(ValueError):
+        solver.solve(1.0, np.zeros(9), damping=0.0)
+
+
+@pytest.mark.parametrize("albedo_width", [0.0, 1.0, 5.0])
+def test_solve_newton(albedo_width: float) -> None:
+    num_lat_zones = 9
+    eg = EarthModel(num_lat_zones)
+    solver = TempSolver(eg, albedo_width=albedo_width)
+
+    temps = np.full(num_lat_zones, -60.0)
+    sm_rising = np.arange(4.0, 8.0, 0.25)
+    for sm in np.concatenate((sm_rising, sm_rising[::-1])):
+        actual = solver.solve_newton(sm, temps)
+        # Each solution is a fixed point of the iterative solver.
+        # (Near the falling tipping point the two solvers may settle on
+        # different coexisting equilibria.)
+        again = solver.solve(sm, actual.temps)
+        assert again.temps == pytest.approx(actual.temps, abs=0.05)
+        temps = actual.temps
+
+
+def test_solve_newton_high_resolution() -> None:
+    num_lat_zones = 100_000
+    eg = EarthModel(num_lat_zones)
+    solver = TempSolver(eg, albedo_width=2.0)
+
+    temps = np.full(num_lat_zones, 200.0)
+    solution = solver.solve_newton(1.0, temps, max_iter=10)
+    again = solver.solve(1.0, solution.temps)
+    assert again.temps == pytest.approx(solution.temps, abs=0.05)
+
+
+def test_solve_newton_backtracking(monkeypatch: pytest.MonkeyPatch) -> None:
+    eg = EarthModel(9)
+    solver = TempSolver(eg, albedo_width=2.0)
+    expected = solver.solve(6.0, np.full(9, -60.0))
+
+    # If no Newton step shrinks the residual, fixed-point steps are
+    # taken instead, so the solver still converges.
+    def bad_step(self: Linearization, rhs: np.ndarray) -> np.ndarray:
+        return np.full_like(rhs, 1000.0)
+
+    monkeypatch.setattr(Linearization, "solve", bad_step)
+    actual = solver.solve_newton(6.0, expected.temps + 1.0)
+    assert actual.temps == pytest.approx(expected.temps, abs=0.5)
+
+
+def test_smooth_albedo() -> None:
+    eg = EarthModel(9)
+    with pytest.raises(ValueError):
+        TempSolver(eg, albedo_width=-1.0)
+
+    solver = TempSolver(eg, albedo_width=2.0)
+    solution = solver.solve(6.0, np.linspace(20.0, -40.0, 9))
+    assert np.all(0.3 <= solution.albedos)
+    assert np.all(solution.albedos <= 0.6)
+    with pytest.raises(ValueError):
+        solver.equilibria(6.0)
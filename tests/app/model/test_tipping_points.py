@@ -0,0 +1,50 @@
+import pytest
+
+from app.model.model import Model
+from app.model.tipping_points import TippingPointLocator
+
+
+def test_locate() -> None:
+    sm_min = 0.4
+    sm_max = 10.0
+    initial_gat = -60.0
+    lat_bands = 9
+    tol = 1.0e-4
+
+    locator = TippingPointLocator(lat_bands)
+    tp = locator.locate(sm_min, sm_max, initial_gat, tol=tol)
+    assert tp.rising is not None
+    assert tp.falling is not None
+    assert sm_min < tp.min_solar_mult < tp.falling
+    assert tp.falling < tp.rising
+    assert tp.rising < tp.max_solar_mult < sm_max
+
+    # A finely subdivided sweep should put its biggest jumps in the
+    # same places.
+    min_step = 1.0e-3
+    results = list(
+        Model().gen_temps(
+            sm_min,
+            sm_max,
+            initial_gat,
+            lat_bands,
+            jump_tol=10.0,
+            min_step=min_step,
+        )
+    )
+    for sign, expected in [(1, tp.rising), (-1, tp.falling)]:
+        seq = [r for r in results if r.delta * sign > 0]
+        jumps = [
+            (abs(r1.solution.avg - r0.solution.avg), r1.solar_mult)
+            for r0, r1 in zip(seq, seq[1:])
+        ]
+        _, mult = max(jumps)
+        assert mult == pytest.approx(expected, abs=2 * min_step)
+
+
+def test_no_jump() -> None:
+    locator = TippingPointLocator(9)
+    tp = locator.locate(0.4, 2.0, -60.0)
+    assert tp.rising is None
+    assert tp.falling is None
+    assert (tp.min_solar_mult, tp.max_solar_mult) == (0.4, 2.0)
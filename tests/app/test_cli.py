@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app import cli
+from app.model.model import Model
+
+
+def test_headless_imports() -> None:
+    code = "import sys, app.cli; print('PySide6' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert output.stdout.strip() == "False"
+
+
+def test_run_csv(tmp_path: Path) -> None:
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"lat_bands": 18, "max_solar_mult": 6.0}))
+    out_path = tmp_path / "out.csv"
+    args = ["run", "--config", str(config), "--max-solar-mult", "8"]
+    assert cli.main(args + ["-o", str(out_path), "--block-size", "3"]) == 0
+
+    expected = list(Model().gen_temps(4.0, 8.0, -60.0, 18))
+    with out_path.open(newline="") as inf:
+        rows = list(csv.DictReader(inf))
+    assert len(rows) == len(expected)
+    for row, e in zip(rows, expected):
+        assert float(row["solar_mult"]) == e.solar_mult
+        assert float(row["avg"]) == e.solution.avg
+        assert float(row["temp_17"]) == e.solution.temps[17]
+
+
+def test_config(tmp_path: Path, capsysbinary) -> None:
+    config = tmp_path / "config.json"
+    config.write_text(json.dumps({"format": "npz", "lat_bands": 18}))
+    assert cli.main(["sweep", "--config", str(config)]) == 0
+    arrays = np.load(io.BytesIO(capsysbinary.readouterr().out))
+    assert arrays["case_0_temps"].shape[1] == 18
+
+    config.write_text(json.dumps({"lat_bandz": 18}))
+    with pytest.raises(SystemExit):
+        cli.main(["run", "--config", str(config)])
+    assert b"lat_bandz" in capsysbinary.readouterr().err
+
+
+def test_sweep_npz(tmp_path: Path, capsysbinary) -> None:
+    args = ["sweep", "--lat-bands", "9", "18", "--format", "npz"]
+    assert cli.main(args + ["--max-workers", "1"]) == 0
+    captured = capsysbinary.readouterr()
+    assert b"results in" in captured.err
+
+    arrays = np.load(io.BytesIO(captured.out))
+    assert arrays["case_0_temps"].shape[1] == 9
+    assert arrays["case_1_temps"].shape[1] == 18
+    expected = list(Model().gen_temps(4.0, 8.0, -60.0, 18))
+    avgs = [r.solution.avg for r in expected]
+    assert np.array_equal(arrays["case_1_avgs"], avgs)
+    # Temperatures are as precise as those written as CSV.
+    temps = [r.solution.temps for r in expected]
+    assert np.array_equal(arrays["case_1_temps"], temps)
+
+
+def test_sweep_csv(capsys) -> None:
+    args = ["sweep", "--lat-bands", "9", "18", "--max-workers", "1"]
+    assert cli.main(args) == 0
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+
+    # Every row is as wide as the header; fewer bands leave blanks.
+    header = rows[0]
+    assert header[-1] == "temp_17"
+    assert all(len(row) == len(header) for row in rows)
+    by_bands = {int(row[0]): row for row in rows[1:]}
+    assert by_bands[9][-9:] == [""] * 9
+    assert "" not in by_bands[18]
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (["--min-solar-mult", "4", "--max-solar-mult", "4"], b"less than"),
+        (["--num-solar-mults", "1"], b"at least 2"),
+        (["--lat-bands", "0"], b"at least 1"),
+    ],
+)
+def test_bad_args(args: list[str], message: bytes, capsysbinary) -> None:
+    for command in ["run", "sweep"]:
+        with pytest.raises(SystemExit):
+            cli.main([command] + args)
+        assert message in capsysbinary.readouterr().err
@@ -0,0 +1,46 @@
+import typing as tp
+
+import pytest
+from PySide6.QtCore import QEventLoop, QTimer, SignalInstance
+from PySide6.QtWidgets import QApplication
+
+Wait = tp.Callable[..., None]
+
+
+@pytest.fixture
+def qapp() -> QApplication:
+    """Get the application, creating it if need be."""
+    # Widgets need a QApplication, so don't settle for a
+    # QCoreApplication.
+    return QApplication.instance() or QApplication([])
+
+
+def _wait(
+    msec: int,
+    *signals: SignalInstance,
+    until: tp.Callable[[], bool] | None = None,
+) -> None:
+    # Run the event loop for up to msec.  Stop early when any of signals
+    # is emitted, once until(), if given, is true.
+    loop = QEventLoop()
+
+    def check(*_args: tp.Any) -> None:
+        if until is None or until():
+            loop.quit()
+
+    for signal in signals:
+        signal.connect(check)
+    QTimer.singleShot(msec, loop.quit)
+    loop.exec()
+    for signal in signals:
+        signal.disconnect(check)
+
+
+@pytest.fixture
+def wait(qapp: QApplication) -> Wait:
+    """
+    Get a function which runs the event loop for up to msec, or until
+    one of the given signals is emitted and until(), if given, is true:
+    wait(msec, *signals, until=None).
+    """
+    return _wait
@@ -1,3 +1,4 @@
+import itertools
 from pathlib import Path
 
 import numpy as np
@@ -10,9 +11,12 @@ ATM1TestCases = list[tuple[list[float], set[int]]]
 
 
 class _TestedAlbedoTextureMapper(AlbedoTextureMapper):
-    def working_dir(self) -> Path:
+    def working_dir(self) -> Path | None:
         return self._working_dir
 
+    def cached_keys(self) -> list[bytes]:
+        return list(self._images)
+
 
 def atm1_cases() -> ATM1TestCases:
     """Ruff thinks this test fixture needs a docstring."""
@@ -63,3 +67,70 @@ def test_atm1(albedos_in, expected) -> None:
     # Disabled - cannot guarantee m.__del__ completes before
     # the cleanup test.
     # del m
+
+
+def test_atm_cache() -> None:
+    """Images are cached in memory, most recently used first."""
+    m = _TestedAlbedoTextureMapper(max_images=2)
+    a1 = np.array([0.3, 0.6])
+    a2 = np.array([0.6, 0.6])
+    a3 = np.array([0.3, 0.3])
+
+    img1 = m.img_from_albedos(a1)
+    assert m.img_from_albedos(a1.copy()).cacheKey() == img1.cacheKey()
+    m.img_from_albedos(a2)
+    m.img_from_albedos(a1)
+    m.img_from_albedos(a3)
+    # a2 was least recently used, so it was evicted.
+    assert m.img_from_albedos(a1).cacheKey() == img1.cacheKey()
+    assert m.cached_keys() == [
+        (255 * a3).astype(np.uint8).tobytes(),
+        (255 * a1).astype(np.uint8).tobytes(),
+    ]
+
+    # Nothing is written to disk.
+    assert m.working_dir() is None
+
+
+@pytest.mark.parametrize("num_bands, height", [(18, 200), (720, 4096)])
+def test_atm_resolution(num_bands, height) -> None:
+    """Every band gets at least one pixel row, equatorial bands more."""
+    m = _TestedAlbedoTextureMapper(height=height)
+    # Alternate values, so that each band is a separate run of pixels.
+    albedos = np.resize([0.2, 0.8], num_bands)
+    img = m.img_from_albedos(albedos)
+    assert img.height() == height
+
+    column = [img.pixelColor(0, y).red() for y in range(img.height())]
+    expected = (255 * albedos).astype(np.uint8)
+    runs = [
+        (value, len(list(group)))
+        for value, group in itertools.groupby(column)
+    ]
+    assert [value for value, _ in runs] == expected.tolist()
+    lengths = [length for _, length in runs]
+    assert min(lengths) >= 1
+    assert lengths[num_bands // 2] > lengths[0]
+
+
+def test_atm_many_bands() -> None:
+    """With more bands than rows, the image grows."""
+    m = _TestedAlbedoTextureMapper(height=100)
+    img = m.img_from_albedos(np.full(360, 0.5))
+    assert img.height() == 360
+
+
+def test_atm_prerender() -> None:
+    """Images can be built in the background, once per albedo pattern."""
+    m = _TestedAlbedoTextureMapper()
+    patterns = [np.array([0.3] * i + [0.6] * (9 - i)) for i in range(10)]
+    futures = m.prerender(patterns + patterns)
+    assert len(futures) == len(patterns)
+    images = [f.result() for f in futures]
+
+    assert len(m.cached_keys()) == len(patterns)
+    for albedos, img in zip(patterns, images):
+        assert m.img_from_albedos(albedos).cacheKey() == img.cacheKey()
+
+    # Nothing more to do.
+    assert m.prerender(patterns) == []
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+from PySide6 import QtCharts
+from PySide6.QtCore import QPointF
+from PySide6.QtWidgets import QApplication
+
+from app.layout.mousing_chart import MousingChart
+from app.model.model import AvgTempResult
+from app.model.temp_solver import Solution
+from app.view_controllers import chart_controller
+from app.view_controllers.chart_controller import ChartController
+
+from .conftest import Wait
+
+
+def _controller() -> tuple[ChartController, QtCharts.QChartView]:
+    chart = MousingChart()
+    view = QtCharts.QChartView(chart)
+    return (ChartController(chart, view), view)
+
+
+def _rising_series(view: QtCharts.QChartView) -> QtCharts.QLineSeries:
+    # The rising series is the first one added to the chart.
+    return view.chart().series()[0]
+
+
+def _result(delta: float, solar_mult: float, avg: float) -> AvgTempResult:
+    temps = np.full(3, avg)
+    return AvgTempResult(delta, solar_mult, Solution(temps, temps, avg))
+
+
+def test_merge_and_nearest(qapp: QApplication) -> None:
+    cc, view = _controller()
+    assert cc.get_rising_solution(1.0) is None
+
+    cc.add_results([_result(1.0, x, x) for x in [3.0, 1.0, 2.0]])
+    cc.add_result(_result(-1.0, 2.5, -2.5))
+    # Replace a point.
+    cc.add_result(_result(1.0, 2.0, 20.0))
+
+    assert cc.get_rising_solution(0.0).solar_mult == 1.0
+    assert cc.get_rising_solution(1.4).solar_mult == 1.0
+    assert cc.get_rising_solution(1.6).solution.avg == 20.0
+    assert cc.get_rising_solution(9.0).solar_mult == 3.0
+    assert cc.get_falling_solution(0.0).solar_mult == 2.5
+
+    rising = _rising_series(view).points()
+    assert [(p.x(), p.y()) for p in rising] == [
+        (1.0, 1.0),
+        (2.0, 20.0),
+        (3.0, 3.0),
+    ]
+
+    cc.clear()
+    assert cc.get_rising_solution(1.0) is None
+    assert _rising_series(view).count() == 0
+
+
+def test_many_points(
+    qapp: QApplication, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cc, view = _controller()
+    num_points = 100_000
+    xs = np.random.default_rng(0).permutation(num_points) / 1000.0
+    for batch in np.array_split(xs, 100):
+        cc.add_results([_result(1.0, x, 2.0 * x) for x in batch])
+    cc.finished_adding()
+    series = _rising_series(view)
+    assert series.count() == num_points
+    # Points are sorted by solar multiplier.
+    series_xs = np.array([p.x() for p in series.points()])
+    assert np.array_equal(series_xs, np.sort(xs))
+
+    # Each lookup is one binary search.
+    num_searches = 0
+    searchsorted = np.searchsorted
+
+    def counting_searchsorted(*args: object, **kwargs: object) -> object:
+        nonlocal num_searches
+        num_searches += 1
+        return searchsorted(*args, **kwargs)
+
+    monkeypatch.setattr(
+        chart_controller.np, "searchsorted", counting_searchsorted
+    )
+    queries = np.linspace(0.0, 99.999, 1000)
+    for x in queries:
+        result = cc.get_rising_solution(x)
+        expected = series_xs[np.argmin(np.abs(series_xs - x))]
+        assert abs(result.solar_mult - x) == abs(expected - x)
+        assert result.solution.avg == 2.0 * result.solar_mult
+    assert num_searches == len(queries)
+
+
+def _hover_at(view: QtCharts.QChartView, x: float) -> None:
+    # Hover over the point on the chart for solar multiplier x.
+    chart = view.chart()
+    scene_pos = chart.mapToScene(chart.mapToPosition(QPointF(x, 0.0)))
+    chart.hovered.emit(QPointF(view.mapFromScene(scene_pos)))
+
+
+def test_hover_coalescing(wait: Wait) -> None:
+    cc, view = _controller()
+    cc.add_results([_result(1.0, x, x) for x in [4.0, 8.0]])
+    cc.finished_adding()
+    # Lay out the chart.
+    view.resize(640, 480)
+    view.show()
+    wait(50)
+
+    hover_positions = []
+    selections = []
+    cc.chart_hover_pos.connect(hover_positions.append)
+    cc.selected_solar_mult.connect(selections.append)
+
+    # A burst of hover events is handled once, at the latest position.
+    for x in np.linspace(5.0, 7.0, 50):
+        _hover_at(view, x)
+    wait(100)
+    assert len(hover_positions) == 1
+    assert selections == [pytest.approx(7.0, abs=0.01)]
+
+    # Tiny moves, relative to the x axis range, don't change the
+    # selection.
+    _hover_at(view, 7.0 + 0.002)
+    wait(100)
+    assert len(hover_positions) == 2
+    assert len(selections) == 1
+
+    _hover_at(view, 7.5)
+    wait(100)
+    assert selections[1:] == [pytest.approx(7.5, abs=0.01)]
@@ -0,0 +1,54 @@
+import numpy as np
+
+from app.model.model import Model
+from app.model.solution_cache import SolutionCache
+from app.view_controllers.hover_solver import HoverSolver
+
+from .conftest import Wait
+
+
+def test_hover_solver(wait: Wait) -> None:
+    model = Model(SolutionCache())
+    results = list(model.gen_temps(4.0, 8.0, -60.0, 9))
+    rising = [r for r in results if r.delta > 0]
+    falling = [r for r in results if r.delta <= 0]
+
+    hs = HoverSolver(model, max_results=2, num_points=40)
+    solved: list = []
+    hs.results_ready.connect(solved.extend)
+    hs.set_sweep(4.0, 8.0, -60.0, 9)
+
+    # Close enough to a sweep result.
+    assert hs.best(4.81, rising[2], rising[2]) is rising[2]
+
+    # Between sweep results, the nearest one is shown until the solve
+    # finishes.
+    assert hs.best(5.0, rising[2], rising[2]) is rising[2]
+    assert hs.best(5.0, falling[7], falling[7]) is falling[7]
+    wait(5000, hs.results_ready, until=lambda: len(solved) >= 2)
+    assert len(solved) == 2
+
+    up = hs.best(5.01, rising[2], rising[2])
+    assert up is not rising[2]
+    assert up.delta > 0
+    assert abs(up.solar_mult - 5.0) < 1.0e-9
+    fine = list(model.gen_temps(4.0, 8.0, -60.0, 9, num_solar_mults=20))
+    expected = [
+        r for r in fine if r.delta > 0 and abs(r.solar_mult - 5.0) < 1.0e-9
+    ][0]
+    assert np.allclose(up.solution.temps, expected.solution.temps, atol=0.1)
+
+    down = hs.best(5.01, falling[7], falling[7])
+    assert down.delta < 0
+    assert abs(down.solar_mult - 5.0) < 1.0e-9
+
+    # The cache is bounded.
+    hs.best(6.0, rising[4], rising[4])
+    wait(5000, hs.results_ready)
+    assert len(solved) == 3
+    assert hs.best(5.0, rising[2], rising[2]) is rising[2]
+
+    # A new sweep discards old results.
+    hs.set_sweep(4.0, 9.0, -60.0, 9)
+    assert hs.best(6.0, rising[4], rising[4]) is rising[4]
+    hs.shutdown()
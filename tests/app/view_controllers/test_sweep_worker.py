@@ -0,0 +1,77 @@
+import threading
+
+from app.model.model import Model
+from app.model.temp_solver import Error
+from app.view_controllers.sweep_worker import SweepWorker
+
+from .conftest import Wait
+
+
+def test_sweep_worker(wait: Wait) -> None:
+    worker = SweepWorker(debounce_msec=10, batch_msec=0)
+    batches = []
+    worker.results_ready.connect(batches.append)
+
+    model = Model()
+    threads = set()
+
+    def make_gen(max_solar_mult: float):
+        threads.add(threading.get_ident())
+        return model.gen_temps(4.0, max_solar_mult, -60.0, 9)
+
+    # Only the last of several quick requests runs.
+    worker.start(lambda: make_gen(7.0))
+    worker.start(lambda: make_gen(8.0))
+    wait(10000, worker.finished)
+    worker.shutdown()
+
+    assert threading.get_ident() not in threads
+    results = [r for batch in batches for r in batch]
+    expected = list(model.gen_temps(4.0, 8.0, -60.0, 9))
+    assert [r.solar_mult for r in results] == [r.solar_mult for r in expected]
+    assert len(threads) == 1
+
+
+def test_sweep_worker_cancel(wait: Wait) -> None:
+    worker = SweepWorker(debounce_msec=0)
+    batches = []
+    worker.results_ready.connect(batches.append)
+
+    worker.start(lambda: Model().gen_temps(4.0, 8.0, -60.0, 9))
+    worker.cancel()
+    wait(200, worker.finished)
+    worker.shutdown()
+    assert batches == []
+
+
+def test_sweep_worker_failed(wait: Wait) -> None:
+    worker = SweepWorker(debounce_msec=0, batch_msec=1000)
+    batches = []
+    failures = []
+    worker.results_ready.connect(batches.append)
+    worker.failed.connect(failures.append)
+
+    def gen_failing():
+        yield from Model().gen_temps(4.0, 4.8, -60.0, 9, num_solar_mults=2)
+        raise Error("Failed to converge after 5 iterations.")
+
+    worker.start(gen_failing)
+    wait(10000, worker.failed, worker.finished)
+    worker.shutdown()
+
+    # Results before the failure are delivered.
+    assert [len(batch) for batch in batches] == [4]
+    assert failures == ["Failed to converge after 5 iterations."]
+
+
+def test_sweep_worker_unexpected_error(wait: Wait) -> None:
+    worker = SweepWorker(debounce_msec=0)
+    failures = []
+    worker.failed.connect(failures.append)
+
+    # Any exception ends the sweep with failed, not silence.
+    worker.start(lambda: Model().gen_temps(4.0, 8.0, -60.0, 0))
+    wait(10000, worker.failed, worker.finished)
+    worker.shutdown()
+
+    assert failures == ["AssertionError()"]